@@ -23,7 +23,6 @@ from dataclasses import dataclass, field
 from .agent import Agent
 from ..core.game_state import GameState, Action, ActionType, AvailableActions
 from ..core.game_engine import GameEngine
-from ..core.game_state import GamePhase
 
 
 @dataclass
@@ -206,7 +205,7 @@ class MCTSAgent(Agent):
         
         while not engine.is_game_over and depth < self.simulation_depth:
             # Advance to decision
-            if engine.phase == GamePhase.DRAW:
+            if engine.is_draw_phase:
                 engine.advance_to_next_decision()
             
             if engine.is_game_over:
@@ -246,8 +246,8 @@ class MinimaxAgent(Agent):
             best_action = None
             
             for action in actions:
-                # Clone engine and apply action
-                child_engine = engine.clone()
+                # Fork engine (copy-on-write) and apply action
+                child_engine = engine.snapshot()
                 child_engine.apply_action(action)
                 
                 score, _ = self._minimax(
@@ -269,7 +269,7 @@ class MinimaxAgent(Agent):
             best_action = None
             
             for action in actions:
-                child_engine = engine.clone()
+                child_engine = engine.snapshot()
                 child_engine.apply_action(action)
                 
                 score, _ = self._minimax(
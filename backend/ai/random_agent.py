@@ -14,6 +14,10 @@ from .agent import Agent
 from ..core.game_state import GameState, Action, ActionType, AvailableActions
 
 
+# Random bytes generated per refill of an agent's choice stream
+_STREAM_SIZE = 4096
+
+
 class RandomAgent(Agent):
     """
     An agent that chooses randomly from available actions.
@@ -25,7 +29,8 @@ class RandomAgent(Agent):
     - Randomly chooses which tile to discard
     """
     
-    def __init__(self, name: str = "Random Bot", call_rate: float = 0.3, riichi_rate: float = 0.8):
+    def __init__(self, name: str = "Random Bot", call_rate: float = 0.3, riichi_rate: float = 0.8,
+                 seed: int = None):
         """
         Initialise the random agent.
         
@@ -33,10 +38,44 @@ class RandomAgent(Agent):
             name: Display name.
             call_rate: Probability of calling Pon/Chi/Kan when available (0-1).
             riichi_rate: Probability of declaring Riichi when available (0-1).
+            seed: Seed for this agent's own RNG, for reproducible games.
+                  None seeds it from the OS.
         """
         super().__init__(name)
         self.call_rate = call_rate
         self.riichi_rate = riichi_rate
+        # Own generator rather than the module-level one, so agents don't
+        # share (or disturb) global random state
+        self._rng = random.Random(seed)
+        # Decisions read bytes from a pregenerated stream: one randbytes()
+        # call per refill instead of a random()/choice() call per decision
+        self._stream = b""
+        self._cursor = _STREAM_SIZE
+    
+    def seed(self, seed: int = None):
+        """Reseed this agent's RNG (e.g. per game when reusing agents)."""
+        self._rng.seed(seed)
+        self._cursor = _STREAM_SIZE  # Drop what's left of the old stream
+    
+    def _next_byte(self) -> int:
+        """The next random byte (0-255) from the stream, refilling it when spent."""
+        cursor = self._cursor
+        if cursor == _STREAM_SIZE:
+            self._stream = self._rng.randbytes(_STREAM_SIZE)
+            cursor = 0
+        self._cursor = cursor + 1
+        return self._stream[cursor]
+    
+    def _choice(self, options):
+        """
+        A random element of options. Taking the byte modulo the length
+        slightly favours the first few options, which is fine for a bot.
+        """
+        return options[self._next_byte() % len(options)]
+    
+    def _chance(self, rate: float) -> bool:
+        """True with probability rate (to within 1/256)."""
+        return self._next_byte() < rate * 256
     
     def choose_action(
         self, 
@@ -55,7 +94,7 @@ class RandomAgent(Agent):
         
         # Handle call decisions (Pon/Kan/Chi)
         if available_actions.can_pon or available_actions.can_kan or available_actions.can_chi:
-            if random.random() < self.call_rate:
+            if self._chance(self.call_rate):
                 # Decide what to call (priority: Kan > Pon > Chi)
                 if available_actions.can_kan:
                     return Action(ActionType.KAN, available_actions.player_index)
@@ -63,7 +102,7 @@ class RandomAgent(Agent):
                     return Action(ActionType.PON, available_actions.player_index)
                 elif available_actions.can_chi:
                     # Random chi option
-                    opt = random.choice(available_actions.chi_options)
+                    opt = self._choice(available_actions.chi_options)
                     return Action(ActionType.CHI, available_actions.player_index, chi_option=opt.option_index)
             else:
                 return Action(ActionType.PASS, available_actions.player_index)
@@ -71,13 +110,13 @@ class RandomAgent(Agent):
         # Handle discard decisions
         if available_actions.can_discard:
             # Consider Riichi
-            if available_actions.can_riichi and random.random() < self.riichi_rate:
+            if available_actions.can_riichi and self._chance(self.riichi_rate):
                 # Declare Riichi and discard a valid tile
-                idx = random.choice(available_actions.riichi_discard_indices)
+                idx = self._choice(available_actions.riichi_discard_indices)
                 return Action(ActionType.DECLARE_RIICHI, available_actions.player_index, tile_index=idx)
             
             # Random discard
-            idx = random.choice(available_actions.discard_indices)
+            idx = self._choice(available_actions.discard_indices)
             return Action(ActionType.DISCARD, available_actions.player_index, tile_index=idx)
         
         # Pass if nothing else
@@ -87,7 +126,7 @@ class RandomAgent(Agent):
         # Fallback - should never reach here
         actions = available_actions.get_actions()
         if actions:
-            return random.choice(actions)
+            return self._choice(actions)
         
         raise ValueError("No actions available for RandomAgent!")
 
@@ -101,8 +140,8 @@ class DefensiveRandomAgent(RandomAgent):
     - Prefers discarding "safe" tiles (honors, terminals)
     """
     
-    def __init__(self, name: str = "Defensive Bot"):
-        super().__init__(name, call_rate=0.0, riichi_rate=1.0)
+    def __init__(self, name: str = "Defensive Bot", seed: int = None):
+        super().__init__(name, call_rate=0.0, riichi_rate=1.0, seed=seed)
     
     def choose_action(
         self, 
@@ -125,7 +164,7 @@ class DefensiveRandomAgent(RandomAgent):
         if available_actions.can_discard:
             # Always Riichi if possible
             if available_actions.can_riichi:
-                idx = random.choice(available_actions.riichi_discard_indices)
+                idx = self._choice(available_actions.riichi_discard_indices)
                 return Action(ActionType.DECLARE_RIICHI, available_actions.player_index, tile_index=idx)
             
             # Prefer discarding safe tiles (honors, terminals)
@@ -140,11 +179,11 @@ class DefensiveRandomAgent(RandomAgent):
                     safe_indices.append(i)
             
             if safe_indices and safe_indices[0] in available_actions.discard_indices:
-                idx = random.choice([i for i in safe_indices if i in available_actions.discard_indices])
+                idx = self._choice([i for i in safe_indices if i in available_actions.discard_indices])
                 return Action(ActionType.DISCARD, available_actions.player_index, tile_index=idx)
             
             # Fallback to random
-            idx = random.choice(available_actions.discard_indices)
+            idx = self._choice(available_actions.discard_indices)
             return Action(ActionType.DISCARD, available_actions.player_index, tile_index=idx)
         
         # Fallback
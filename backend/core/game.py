@@ -1,8 +1,8 @@
 import time
-from .tiles import Tile, Suit, Rank
+from .tiles import Tile, Suit, Rank, tile_mask
 from .wall import Wall
 from .player import Player
-from .shanten import ShantenCalculator
+from .shanten import ShantenCalculator, to_frequency_table
 from .scorer import Scorer
 from . import ui
 
@@ -66,9 +66,10 @@ class Game:
             active_player.draw_tile(drawn_tile)
 
             # --- CHECK TSUMO (Win on Draw) ---
-            if self.shanten_calc.calculate_shanten(active_player.hand) == -1:
+            counts = to_frequency_table(active_player.hand)
+            if self.shanten_calc.calculate_shanten(counts, at_most=-1) == -1:
                 # Check Yaku
-                yaku = self.scorer.check_yaku(active_player.hand, active_player.open_melds)
+                yaku = self.scorer.check_yaku(active_player.hand, active_player.open_melds, counts=counts)
                 
                 # Auto-win if Yaku present
                 if yaku:
@@ -105,7 +106,7 @@ class Game:
                 can_declare_riichi = (
                     active_player.is_menzen and 
                     active_player.score >= 1000 and 
-                    self.shanten_calc.calculate_shanten(active_player.hand) == 0
+                    self.shanten_calc.calculate_shanten(active_player.hand, at_most=0) == 0
                 )
 
                 if can_declare_riichi:
@@ -113,8 +114,7 @@ class Game:
                     riichi_choice = ui.console.input("Declare Riichi? (bets 1000 pts) [y/N] > ").lower()
                     
                     if riichi_choice == 'y':
-                        active_player.is_riichi = True
-                        active_player.score -= 1000
+                        active_player.declare_riichi()
                         ui.console.print("[bold yellow] YOU DECLARE RIICHI![/]")
                         # In a real game, you would rotate the tile here.
                         # For now, we proceed to standard discard input.
@@ -139,11 +139,10 @@ class Game:
             # If bot is tenpai, closed hand, and not in riichi -> 50% chance to declare
             if (not active_player.is_riichi and 
                 active_player.is_menzen and 
-                self.shanten_calc.calculate_shanten(active_player.hand) == 0):
+                self.shanten_calc.calculate_shanten(active_player.hand, at_most=0) == 0):
                 
                 # Simple logic: Just do it
-                active_player.is_riichi = True
-                active_player.score -= 1000
+                active_player.declare_riichi()
                 ui.console.print(f"[bold yellow] {active_player.name} DECLARES RIICHI! [/]")
 
             # Bot Discard
@@ -165,28 +164,27 @@ class Game:
             
             # 1. Check Shanten (-1 means valid hand shape)
             test_hand = p.hand + [discard]
-            if self.shanten_calc.calculate_shanten(test_hand) == -1:
+            counts = to_frequency_table(test_hand)
+            if self.shanten_calc.calculate_shanten(counts, at_most=-1) == -1:
                 
                 # 2. --- NEW: FURITEN CHECK ---
                 # Calculate the specific tiles this player was waiting for
                 # (Note: We check p.hand, NOT test_hand, because we need the waits BEFORE the ron)
                 waits = self.shanten_calc.get_waits(p.hand)
                 
-                # Create sets of (suit, value) tuples to ignore Red status
+                # Tile masks are by kind, so they ignore Red status
                 # e.g. "5 Man" and "Red 5 Man" are the same for Furiten rules
-                wait_ids = set((w.suit, w.value) for w in waits)
-                discard_ids = set((t.suit, t.value) for t in p.discards)
                 
                 # Intersection Check: Are ANY of my waits in my river?
                 # If yes, I am Furiten and cannot Ron.
-                if not wait_ids.isdisjoint(discard_ids):
+                if tile_mask(waits) & p.discard_mask:
                     # If it's the human player, let them know why they missed the win
                     if p == self.players[0]:
                         ui.console.print(f"[dim]You are Tenpai, but [bold red]FURITEN[/] (Wait in River). Cannot Ron.[/]")
                     continue # SKIP this player, deny the win
                 
                 # 3. Check Yaku (Win Conditions)
-                yaku = self.scorer.check_yaku(test_hand, p.open_melds)
+                yaku = self.scorer.check_yaku(test_hand, p.open_melds, counts=counts)
                 if yaku:
                     ui.console.print(f"\n[bold white on red]RON! {p.name} wins on {active_player.name}'s {discard}![/]")
                     ui.console.print(f"Yaku: {', '.join(yaku)}")
@@ -204,7 +202,7 @@ class Game:
                     choice = ui.console.input("Call Kan? (y/n): ").lower()
                     if choice == 'y':
                         ui.console.print(f"[bold cyan]YOU called KAN![/]")
-                        p.execute_kan(discard)
+                        p.execute_kan(discard, called_from=self.active_player_index)
                         
                         # --- KAN SPECIFIC MECHANICS ---
                         # 1. Draw Replacement
@@ -232,7 +230,7 @@ class Game:
                     choice = ui.console.input("Call Pon? (y/n): ").lower()
                     if choice == 'y':
                         ui.console.print(f"[bold cyan]YOU called PON![/]")
-                        p.execute_pon(discard)
+                        p.execute_pon(discard, called_from=self.active_player_index)
                         self.active_player_index = i
                         self.skip_draw = True
                         return True
@@ -264,7 +262,7 @@ class Game:
                         chosen_indices = chi_options[opt_idx]
                         
                         ui.console.print(f"[bold green]YOU called CHI![/]")
-                        next_player.execute_chi(discard, chosen_indices)
+                        next_player.execute_chi(discard, chosen_indices, called_from=self.active_player_index)
                         
                         # Turn moves to you (which it was going to anyway, but now we skip draw)
                         self.active_player_index = next_p_index
@@ -98,6 +98,27 @@ class GameController:
                 self.agents[i] = PassiveAgent(f"Bot {i}")
                 self.agents[i].player_index = i
     
+    def reset(self):
+        """
+        Prepare for another run_game() with the same engine and agents,
+        instead of building a new controller per game.
+        """
+        self.engine.reset()
+    
+    @property
+    def quiet_mode(self) -> bool:
+        """
+        When set, the engine builds no GameEvents at all: no message
+        formatting, no listener calls, and apply_action returns []. Event
+        callbacks and Agent.on_game_event are not called. For bulk
+        simulation where nobody is watching.
+        """
+        return self.engine.quiet
+    
+    @quiet_mode.setter
+    def quiet_mode(self, value: bool):
+        self.engine.quiet = value
+    
     # =========================================================================
     # UI Callbacks
     # =========================================================================
@@ -130,7 +151,7 @@ class GameController:
     def _notify_state_change(self):
         """Notify UI of state change."""
         if self._on_state_change:
-            state = self.engine.get_state()
+            state = self.engine.get_state_view()
             self._on_state_change(state)
     
     # =========================================================================
@@ -150,7 +171,7 @@ class GameController:
         self.engine.setup()
         
         # Notify agents of game start
-        state = self.engine.get_state()
+        state = self.engine.get_state_view()
         for agent in self.agents:
             if agent:
                 agent.on_game_start(state)
@@ -165,7 +186,7 @@ class GameController:
                 time.sleep(self.turn_delay)
         
         # Game over
-        final_state = self.engine.get_state()
+        final_state = self.engine.get_state_view()
         
         for agent in self.agents:
             if agent:
@@ -180,7 +201,7 @@ class GameController:
         """Execute a single game step (one decision point)."""
         
         # Advance to next decision point if needed
-        if self.engine.phase == GamePhase.DRAW:
+        if self.engine.is_draw_phase:
             self.engine.advance_to_next_decision()
             self._notify_state_change()
         
@@ -188,7 +209,7 @@ class GameController:
             return
         
         # Get current state and available actions
-        state = self.engine.get_state()
+        state = self.engine.get_state_view()
         available = state.available_actions
         
         if not available:
@@ -219,7 +240,7 @@ class GameController:
         if not self.engine.is_game_over:
             self._run_single_step()
         
-        return self.engine.get_state(), self.engine.is_game_over
+        return self.engine.get_state_view(), self.engine.is_game_over
 
 
 class CLIGameController(GameController):
@@ -16,16 +16,16 @@ Key design principles:
 import copy
 from typing import Callable, Optional
 
-from .tiles import Tile, Suit
+from .tiles import Tile, Suit, tile_mask
 from .wall import Wall
 from .player import Player
-from .shanten import ShantenCalculator
+from .shanten import ShantenCalculator, to_frequency_table
 from .scorer import Scorer
 from .game_state import (
     GameState, GamePhase, GameEvent, GameEventType,
     Action, ActionType, AvailableActions,
     PlayerState, TileState, ChiOption,
-    tiles_to_state, create_player_state
+    tiles_to_state, create_player_states
 )
 
 
@@ -37,7 +37,7 @@ class GameEngine:
     - Manages all game state
     - Validates and applies actions
     - Emits events for UI/logging
-    - Can be cloned for AI simulation
+    - Can be cloned (or cheaply snapshotted) for AI simulation
     
     Usage:
         engine = GameEngine()
@@ -68,10 +68,24 @@ class GameEngine:
         self.shanten_calc = ShantenCalculator()
         self.scorer = Scorer()
         
+        self._reset_game_state()
+        
+        # Event listeners
+        self._event_listeners: list[Callable[[GameEvent], None]] = []
+        self.quiet = False  # Skip building events entirely (e.g. bulk simulation)
+        
+        # Set while the wall and players are shared with a snapshot()
+        self._cow_shared = False
+        
+        # get_state_view()'s cached state, cleared whenever the engine changes
+        self._state_view = None
+    
+    def _reset_game_state(self):
+        """Set the per-game scalars to their pre-setup values."""
         # Game state
         self.turn_count = 0
         self.active_player_index = 0
-        self.phase = GamePhase.SETUP
+        self._set_phase(GamePhase.SETUP)
         
         # Turn state
         self._skip_draw = False         # Skip draw after calling Pon/Chi/Kan
@@ -86,9 +100,6 @@ class GameEngine:
         # Win state
         self._winner_index = None
         self._winning_yaku = []
-        
-        # Event listeners
-        self._event_listeners: list[Callable[[GameEvent], None]] = []
     
     # =========================================================================
     # PUBLIC API
@@ -108,10 +119,30 @@ class GameEngine:
         for listener in self._event_listeners:
             listener(event)
     
-    @property
-    def is_game_over(self) -> bool:
-        """Check if the game has ended."""
-        return self.phase in (GamePhase.GAME_OVER_WIN, GamePhase.GAME_OVER_DRAW)
+    def _set_phase(self, phase: GamePhase):
+        """
+        Change phase. Also keeps is_draw_phase and is_game_over up to date,
+        plain attributes so game loops checking them every step skip the
+        enum comparisons.
+        """
+        self.phase = phase
+        self.is_draw_phase = phase is GamePhase.DRAW
+        self.is_game_over = phase is GamePhase.GAME_OVER_WIN or phase is GamePhase.GAME_OVER_DRAW
+    
+    def reset(self):
+        """
+        Return the engine to its freshly-constructed state, ready for setup(),
+        reusing its wall, players and caches rather than building new ones.
+        Event listeners and quiet mode are kept.
+        """
+        if self._cow_shared:
+            self._unshare()
+        self._state_view = None
+        
+        self.wall.reset()
+        for p in self.players:
+            p.reset()
+        self._reset_game_state()
     
     def setup(self) -> list[GameEvent]:
         """
@@ -120,6 +151,10 @@ class GameEngine:
         Returns:
             List of GameEvents that occurred during setup.
         """
+        if self._cow_shared:
+            self._unshare()
+        self._state_view = None
+        
         events = []
         
         # Deal 13 tiles to each player
@@ -134,22 +169,39 @@ class GameEngine:
         
         self.turn_count = 0
         self.active_player_index = 0
-        self.phase = GamePhase.DRAW
+        self._set_phase(GamePhase.DRAW)
         
-        events.append(GameEvent(
-            event_type=GameEventType.GAME_STARTED,
-            message="Game started. Deal complete.",
-            data={
-                "dora_indicators": tiles_to_state(self.wall.dora_indicators),
-                "wall_remaining": self.wall.remaining
-            }
-        ))
+        if not self.quiet:
+            events.append(GameEvent(
+                event_type=GameEventType.GAME_STARTED,
+                message="Game started. Deal complete.",
+                data={
+                    "dora_indicators": tiles_to_state(self.wall.dora_indicators),
+                    "wall_remaining": self.wall.remaining
+                }
+            ))
         
         for event in events:
             self._emit_event(event)
         
         return events
     
+    def get_state_view(self) -> GameState:
+        """
+        The full-information state, as get_state() returns, but built at most
+        once per engine change: repeated reads between actions (a loop that
+        checks the state, asks an agent and updates a UI) share one snapshot.
+        """
+        state = self._state_view
+        if state is None:
+            state = self._state_view = self.get_state()
+        return state
+    
+    @property
+    def winner_index(self) -> Optional[int]:
+        """Seat of the winner, or None while the game is running or after a draw."""
+        return self._winner_index
+    
     def get_state(self, for_player: int = None) -> GameState:
         """
         Get the current game state.
@@ -161,14 +213,8 @@ class GameEngine:
         Returns:
             Immutable GameState snapshot.
         """
-        # Build player states
-        player_states = []
-        for i, p in enumerate(self.players):
-            # Include hand only for the requesting player or if for_player is None
-            include_hand = (for_player is None) or (i == for_player)
-            player_states.append(create_player_state(
-                p, i, self.shanten_calc, include_hand=include_hand
-            ))
+        # Build player states (hand included only for for_player, or all if None)
+        player_states = create_player_states(self.players, self.shanten_calc, for_player)
         
         # Build available actions for current decision point
         available_actions = self._get_available_actions()
@@ -177,7 +223,7 @@ class GameEngine:
             turn_count=self.turn_count,
             phase=self.phase,
             active_player_index=self.active_player_index,
-            players=tuple(player_states),
+            players=player_states,
             wall_remaining=self.wall.remaining,
             dora_indicators=tiles_to_state(self.wall.dora_indicators),
             last_discard=TileState.from_tile(self._last_discard) if self._last_discard else None,
@@ -201,6 +247,10 @@ class GameEngine:
         Raises:
             ValueError: If the action is invalid for the current state.
         """
+        if self._cow_shared:
+            self._unshare()
+        self._state_view = None
+        
         events = []
         
         # Validate action
@@ -253,6 +303,30 @@ class GameEngine:
         """
         return copy.deepcopy(self)
     
+    def snapshot(self) -> 'GameEngine':
+        """
+        Copy-on-write fork of the engine, for lookahead that forks often.
+        
+        The snapshot shares the wall, players and shanten cache with this
+        engine instead of deep-copying them. Whichever engine mutates first
+        (setup, apply_action, advance_to_next_decision) takes its own copy
+        of the shared parts, so forks that are only inspected cost almost
+        nothing. Event listeners are not carried over.
+        
+        Returns:
+            A new GameEngine with identical state.
+        """
+        fork = copy.copy(self)
+        fork._event_listeners = []
+        self._cow_shared = fork._cow_shared = True
+        return fork
+    
+    def _unshare(self):
+        """Take private copies of the state shared with snapshots, before writing to it."""
+        self.wall = self.wall.snapshot()
+        self.players = [p.snapshot() for p in self.players]
+        self._cow_shared = False
+    
     def advance_to_next_decision(self) -> list[GameEvent]:
         """
         Advance the game state to the next decision point.
@@ -261,9 +335,13 @@ class GameEngine:
         Returns:
             List of GameEvents that occurred.
         """
+        if self._cow_shared:
+            self._unshare()
+        self._state_view = None
+        
         events = []
         
-        if self.phase == GamePhase.DRAW:
+        if self.is_draw_phase:
             events.extend(self._do_draw_phase())
         
         return events
@@ -297,22 +375,24 @@ class GameEngine:
             discard_indices=tuple(range(len(player.hand)))
         )
         
-        # Check for Tsumo (win on self-draw)
-        if self.shanten_calc.calculate_shanten(player.hand) == -1:
-            yaku = self.scorer.check_yaku(player.hand, player.open_melds, is_riichi=player.is_riichi)
+        # Check for Tsumo (win on self-draw), sharing one frequency table
+        counts = to_frequency_table(player.hand)
+        if self.shanten_calc.calculate_shanten(counts, at_most=-1) == -1:
+            yaku = self.scorer.check_yaku(player.hand, player.open_melds,
+                                          is_riichi=player.is_riichi, counts=counts)
             if yaku:
                 actions.can_tsumo = True
                 actions.tsumo_yaku = tuple(yaku)
         
         # Check for Riichi opportunity
         if not player.is_riichi and player.is_menzen and player.score >= 1000:
-            if self.shanten_calc.calculate_shanten(player.hand) == 0:
+            if self.shanten_calc.calculate_shanten(player.hand, at_most=0) == 0:
                 # Find which discards keep tenpai
                 riichi_discards = []
                 for i in range(len(player.hand)):
                     # Simulate discard
                     test_hand = player.hand[:i] + player.hand[i+1:]
-                    if self.shanten_calc.calculate_shanten(test_hand) == 0:
+                    if self.shanten_calc.calculate_shanten(test_hand, at_most=0) == 0:
                         riichi_discards.append(i)
                 
                 if riichi_discards:
@@ -338,14 +418,14 @@ class GameEngine:
             
             # Check if this player can Ron
             test_hand = p.hand + [self._last_discard]
-            if self.shanten_calc.calculate_shanten(test_hand) == -1:
+            counts = to_frequency_table(test_hand)
+            if self.shanten_calc.calculate_shanten(counts, at_most=-1) == -1:
                 # Check Furiten
                 waits = self.shanten_calc.get_waits(p.hand)
-                wait_ids = set((w.suit, w.value) for w in waits)
-                discard_ids = set((t.suit, t.value) for t in p.discards)
                 
-                if wait_ids.isdisjoint(discard_ids):  # Not furiten
-                    yaku = self.scorer.check_yaku(test_hand, p.open_melds, is_riichi=p.is_riichi)
+                if not tile_mask(waits) & p.discard_mask:  # Not furiten
+                    yaku = self.scorer.check_yaku(test_hand, p.open_melds, is_riichi=p.is_riichi,
+                                                  counts=counts)
                     if yaku:
                         return AvailableActions(
                             player_index=i,
@@ -443,7 +523,7 @@ class GameEngine:
         
         if self._skip_draw:
             self._skip_draw = False
-            self.phase = GamePhase.DISCARD
+            self._set_phase(GamePhase.DISCARD)
             return events
         
         # Draw a tile
@@ -451,25 +531,27 @@ class GameEngine:
         
         if not drawn_tile:
             # Wall empty - exhaustive draw
-            self.phase = GamePhase.GAME_OVER_DRAW
-            events.append(GameEvent(
-                event_type=GameEventType.EXHAUSTIVE_DRAW,
-                message="Wall empty! Ryuukyoku (Exhaustive Draw)"
-            ))
+            self._set_phase(GamePhase.GAME_OVER_DRAW)
+            if not self.quiet:
+                events.append(GameEvent(
+                    event_type=GameEventType.EXHAUSTIVE_DRAW,
+                    message="Wall empty! Ryuukyoku (Exhaustive Draw)"
+                ))
             return events
         
         self._drawn_tile = drawn_tile
         player.draw_tile(drawn_tile)
         
-        events.append(GameEvent(
-            event_type=GameEventType.TILE_DRAWN,
-            player_index=self.active_player_index,
-            tile=TileState.from_tile(drawn_tile),
-            message=f"{player.name} draws a tile"
-        ))
+        if not self.quiet:
+            events.append(GameEvent(
+                event_type=GameEventType.TILE_DRAWN,
+                player_index=self.active_player_index,
+                tile=TileState.from_tile(drawn_tile),
+                message=f"{player.name} draws a tile"
+            ))
         
         # Check for automatic Tsumo (complete hand with yaku)
-        self.phase = GamePhase.DISCARD
+        self._set_phase(GamePhase.DISCARD)
         
         return events
     
@@ -483,28 +565,30 @@ class GameEngine:
         self._last_discard_player = action.player_index
         self._drawn_tile = None
         
-        events.append(GameEvent(
-            event_type=GameEventType.TILE_DISCARDED,
-            player_index=action.player_index,
-            tile=TileState.from_tile(discarded),
-            message=f"{player.name} discards {discarded}"
-        ))
+        if not self.quiet:
+            events.append(GameEvent(
+                event_type=GameEventType.TILE_DISCARDED,
+                player_index=action.player_index,
+                tile=TileState.from_tile(discarded),
+                message=f"{player.name} discards {discarded}"
+            ))
         
         # Move to call checking phase
-        self.phase = GamePhase.CALL_FOR_WIN
+        self._set_phase(GamePhase.CALL_FOR_WIN)
         
         # If no one can win, check for meld calls
         if not self._get_call_for_win_actions():
-            self.phase = GamePhase.CALL_FOR_MELD
+            self._set_phase(GamePhase.CALL_FOR_MELD)
             
             # If no one can call, advance turn
             if not self._get_call_for_meld_actions():
                 self._advance_turn()
-                events.append(GameEvent(
-                    event_type=GameEventType.TURN_CHANGED,
-                    player_index=self.active_player_index,
-                    message=f"Turn passes to {self.players[self.active_player_index].name}"
-                ))
+                if not self.quiet:
+                    events.append(GameEvent(
+                        event_type=GameEventType.TURN_CHANGED,
+                        player_index=self.active_player_index,
+                        message=f"Turn passes to {self.players[self.active_player_index].name}"
+                    ))
         
         return events
     
@@ -514,14 +598,14 @@ class GameEngine:
         player = self.players[action.player_index]
         
         # Declare Riichi
-        player.is_riichi = True
-        player.score -= 1000
+        player.declare_riichi()
         
-        events.append(GameEvent(
-            event_type=GameEventType.RIICHI_DECLARED,
-            player_index=action.player_index,
-            message=f"{player.name} declares RIICHI!"
-        ))
+        if not self.quiet:
+            events.append(GameEvent(
+                event_type=GameEventType.RIICHI_DECLARED,
+                player_index=action.player_index,
+                message=f"{player.name} declares RIICHI!"
+            ))
         
         # Then discard
         discarded = player.discard_tile(action.tile_index)
@@ -529,17 +613,18 @@ class GameEngine:
         self._last_discard_player = action.player_index
         self._drawn_tile = None
         
-        events.append(GameEvent(
-            event_type=GameEventType.TILE_DISCARDED,
-            player_index=action.player_index,
-            tile=TileState.from_tile(discarded),
-            message=f"{player.name} discards {discarded}"
-        ))
+        if not self.quiet:
+            events.append(GameEvent(
+                event_type=GameEventType.TILE_DISCARDED,
+                player_index=action.player_index,
+                tile=TileState.from_tile(discarded),
+                message=f"{player.name} discards {discarded}"
+            ))
         
         # Move to call checking
-        self.phase = GamePhase.CALL_FOR_WIN
+        self._set_phase(GamePhase.CALL_FOR_WIN)
         if not self._get_call_for_win_actions():
-            self.phase = GamePhase.CALL_FOR_MELD
+            self._set_phase(GamePhase.CALL_FOR_MELD)
             if not self._get_call_for_meld_actions():
                 self._advance_turn()
         
@@ -554,14 +639,15 @@ class GameEngine:
         
         self._winner_index = action.player_index
         self._winning_yaku = yaku
-        self.phase = GamePhase.GAME_OVER_WIN
+        self._set_phase(GamePhase.GAME_OVER_WIN)
         
-        events.append(GameEvent(
-            event_type=GameEventType.TSUMO_WIN,
-            player_index=action.player_index,
-            yaku=tuple(yaku),
-            message=f"TSUMO! {player.name} wins!"
-        ))
+        if not self.quiet:
+            events.append(GameEvent(
+                event_type=GameEventType.TSUMO_WIN,
+                player_index=action.player_index,
+                yaku=tuple(yaku),
+                message=f"TSUMO! {player.name} wins!"
+            ))
         
         return events
     
@@ -576,18 +662,19 @@ class GameEngine:
         
         self._winner_index = action.player_index
         self._winning_yaku = yaku
-        self.phase = GamePhase.GAME_OVER_WIN
+        self._set_phase(GamePhase.GAME_OVER_WIN)
         
         loser = self.players[self._last_discard_player]
         
-        events.append(GameEvent(
-            event_type=GameEventType.RON_WIN,
-            player_index=action.player_index,
-            tile=TileState.from_tile(self._last_discard),
-            yaku=tuple(yaku),
-            message=f"RON! {player.name} wins on {loser.name}'s {self._last_discard}!",
-            data={"deal_in_player": self._last_discard_player}
-        ))
+        if not self.quiet:
+            events.append(GameEvent(
+                event_type=GameEventType.RON_WIN,
+                player_index=action.player_index,
+                tile=TileState.from_tile(self._last_discard),
+                yaku=tuple(yaku),
+                message=f"RON! {player.name} wins on {loser.name}'s {self._last_discard}!",
+                data={"deal_in_player": self._last_discard_player}
+            ))
         
         return events
     
@@ -596,21 +683,22 @@ class GameEngine:
         events = []
         player = self.players[action.player_index]
         
-        player.execute_pon(self._last_discard)
+        player.execute_pon(self._last_discard, called_from=self._last_discard_player)
         
-        events.append(GameEvent(
-            event_type=GameEventType.PON_CALLED,
-            player_index=action.player_index,
-            tile=TileState.from_tile(self._last_discard),
-            message=f"{player.name} calls PON!"
-        ))
+        if not self.quiet:
+            events.append(GameEvent(
+                event_type=GameEventType.PON_CALLED,
+                player_index=action.player_index,
+                tile=TileState.from_tile(self._last_discard),
+                message=f"{player.name} calls PON!"
+            ))
         
         # Turn moves to caller, skip draw
         self.active_player_index = action.player_index
         self._skip_draw = True
         self._last_discard = None
         self._last_discard_player = None
-        self.phase = GamePhase.DISCARD
+        self._set_phase(GamePhase.DISCARD)
         
         return events
     
@@ -619,14 +707,15 @@ class GameEngine:
         events = []
         player = self.players[action.player_index]
         
-        player.execute_kan(self._last_discard)
+        player.execute_kan(self._last_discard, called_from=self._last_discard_player)
         
-        events.append(GameEvent(
-            event_type=GameEventType.KAN_CALLED,
-            player_index=action.player_index,
-            tile=TileState.from_tile(self._last_discard),
-            message=f"{player.name} calls KAN!"
-        ))
+        if not self.quiet:
+            events.append(GameEvent(
+                event_type=GameEventType.KAN_CALLED,
+                player_index=action.player_index,
+                tile=TileState.from_tile(self._last_discard),
+                message=f"{player.name} calls KAN!"
+            ))
         
         # Draw replacement tile
         replacement = self.wall.draw_replacement()
@@ -634,29 +723,31 @@ class GameEngine:
             player.draw_tile(replacement)
             self._drawn_tile = replacement
             
-            events.append(GameEvent(
-                event_type=GameEventType.REPLACEMENT_DRAWN,
-                player_index=action.player_index,
-                tile=TileState.from_tile(replacement),
-                message=f"{player.name} draws replacement tile"
-            ))
+            if not self.quiet:
+                events.append(GameEvent(
+                    event_type=GameEventType.REPLACEMENT_DRAWN,
+                    player_index=action.player_index,
+                    tile=TileState.from_tile(replacement),
+                    message=f"{player.name} draws replacement tile"
+                ))
         
         # Reveal new dora
         self.wall.reveal_kan_dora()
         new_dora = self.wall.dora_indicators[-1]
         
-        events.append(GameEvent(
-            event_type=GameEventType.DORA_REVEALED,
-            tile=TileState.from_tile(new_dora),
-            message=f"New Dora Indicator: {new_dora}"
-        ))
+        if not self.quiet:
+            events.append(GameEvent(
+                event_type=GameEventType.DORA_REVEALED,
+                tile=TileState.from_tile(new_dora),
+                message=f"New Dora Indicator: {new_dora}"
+            ))
         
         # Turn moves to caller, skip draw (already drew replacement)
         self.active_player_index = action.player_index
         self._skip_draw = True
         self._last_discard = None
         self._last_discard_player = None
-        self.phase = GamePhase.DISCARD
+        self._set_phase(GamePhase.DISCARD)
         
         return events
     
@@ -669,21 +760,22 @@ class GameEngine:
         chi_options = player.can_chi(self._last_discard)
         chosen_indices = chi_options[action.chi_option]
         
-        player.execute_chi(self._last_discard, chosen_indices)
+        player.execute_chi(self._last_discard, chosen_indices, called_from=self._last_discard_player)
         
-        events.append(GameEvent(
-            event_type=GameEventType.CHI_CALLED,
-            player_index=action.player_index,
-            tile=TileState.from_tile(self._last_discard),
-            message=f"{player.name} calls CHI!"
-        ))
+        if not self.quiet:
+            events.append(GameEvent(
+                event_type=GameEventType.CHI_CALLED,
+                player_index=action.player_index,
+                tile=TileState.from_tile(self._last_discard),
+                message=f"{player.name} calls CHI!"
+            ))
         
         # Turn moves to caller, skip draw
         self.active_player_index = action.player_index
         self._skip_draw = True
         self._last_discard = None
         self._last_discard_player = None
-        self.phase = GamePhase.DISCARD
+        self._set_phase(GamePhase.DISCARD)
         
         return events
     
@@ -694,22 +786,24 @@ class GameEngine:
         # Check if we were in win phase or meld phase
         if self.phase == GamePhase.CALL_FOR_WIN:
             # Move to meld checking
-            self.phase = GamePhase.CALL_FOR_MELD
+            self._set_phase(GamePhase.CALL_FOR_MELD)
             
             if not self._get_call_for_meld_actions():
                 self._advance_turn()
-                events.append(GameEvent(
-                    event_type=GameEventType.TURN_CHANGED,
-                    player_index=self.active_player_index
-                ))
+                if not self.quiet:
+                    events.append(GameEvent(
+                        event_type=GameEventType.TURN_CHANGED,
+                        player_index=self.active_player_index
+                    ))
         
         elif self.phase == GamePhase.CALL_FOR_MELD:
             # Advance turn
             self._advance_turn()
-            events.append(GameEvent(
-                event_type=GameEventType.TURN_CHANGED,
-                player_index=self.active_player_index
-            ))
+            if not self.quiet:
+                events.append(GameEvent(
+                    event_type=GameEventType.TURN_CHANGED,
+                    player_index=self.active_player_index
+                ))
         
         return events
     
@@ -718,4 +812,4 @@ class GameEngine:
         self.active_player_index = (self.active_player_index + 1) % 4
         self._last_discard = None
         self._last_discard_player = None
-        self.phase = GamePhase.DRAW
+        self._set_phase(GamePhase.DRAW)
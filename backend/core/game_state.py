@@ -8,12 +8,13 @@ This module provides serialisable representations of game state that can be:
 - Cloned for simulation without affecting real game state
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, replace
 from enum import Enum, auto
+from functools import cached_property
 from typing import Optional
 import copy
 
-from .tiles import Tile, Suit
+from .tiles import Tile, Suit, tile_mask
 
 
 # =============================================================================
@@ -87,7 +88,7 @@ class TileState:
     
     def to_tile(self) -> Tile:
         """Convert back to a Tile object."""
-        return Tile(Suit(self.suit), self.value, self.is_red)
+        return Tile.get(Suit(self.suit), self.value, self.is_red)
     
     def __repr__(self):
         return repr(self.to_tile())
@@ -102,6 +103,10 @@ class MeldState:
     tiles: tuple                # Tuple of TileState
     called_from: int            # Player index the tile was called from
     
+    def __repr__(self):
+        # Same format as the old string melds, e.g. "[Pon: 5m 5m 5m]"
+        return f"[{self.meld_type.capitalize()}: {' '.join(repr(t) for t in self.tiles)}]"
+    
     @classmethod
     def from_string(cls, meld_str: str, called_from: int = -1) -> 'MeldState':
         """
@@ -132,10 +137,11 @@ class PlayerState:
     hand: tuple                             # Tuple of TileState (own hand only)
     hand_size: int                          # Number of tiles in hand (for other players)
     discards: tuple                         # Tuple of TileState (river/kawa)
-    open_melds: tuple                       # Tuple of meld strings (temporary)
+    open_melds: tuple                       # Tuple of MeldState
     shanten: int                            # Shanten count (-1 = complete)
     waits: tuple                            # Tuple of TileState (waiting tiles if tenpai)
     is_furiten: bool                        # Furiten status
+    mutation_seq: int = 0                   # Player.mutation_seq when snapshotted
 
 
 @dataclass(frozen=True)
@@ -166,6 +172,23 @@ class Action:
         return f"Action({', '.join(parts)})"
 
 
+# Actions without indices are identical for a given seat, and Action is frozen,
+# so get_actions() hands out these shared instances instead of allocating new ones.
+_CANONICAL_ACTIONS = {
+    (action_type, player_index): Action(action_type, player_index)
+    for action_type in (ActionType.TSUMO, ActionType.RON, ActionType.PON,
+                        ActionType.KAN, ActionType.PASS)
+    for player_index in range(4)
+}
+
+# Bits of AvailableActions.action_mask, lowest first in the order simple
+# policies usually check them
+MASK_TSUMO = 1 << 0
+MASK_RON = 1 << 1
+MASK_CALL_PASS = 1 << 2     # Offered a Pon/Kan/Chi that can be passed on
+MASK_DISCARD = 1 << 3
+
+
 @dataclass
 class AvailableActions:
     """
@@ -196,36 +219,60 @@ class AvailableActions:
     
     can_pass: bool = False                  # Can decline to call
     
+    @cached_property
+    def action_mask(self) -> int:
+        """
+        The headline options as one int (see the MASK_* bits), so a policy
+        can dispatch on a single lookup instead of a chain of flag checks.
+        Computed once; actions don't change after the engine builds them.
+        """
+        mask = 0
+        if self.can_tsumo:
+            mask |= MASK_TSUMO
+        if self.can_ron:
+            mask |= MASK_RON
+        if self.can_pass and (self.can_pon or self.can_kan or self.can_chi):
+            mask |= MASK_CALL_PASS
+        if self.can_discard:
+            mask |= MASK_DISCARD
+        return mask
+    
+    @cached_property
+    def first_discard_index(self) -> Optional[int]:
+        """The first valid discard index, or None if there is none."""
+        return self.discard_indices[0] if self.discard_indices else None
+    
     def get_actions(self) -> list:
         """Returns a list of all valid Action objects."""
+        pid = self.player_index
         actions = []
         
         if self.can_tsumo:
-            actions.append(Action(ActionType.TSUMO, self.player_index))
+            actions.append(_CANONICAL_ACTIONS[(ActionType.TSUMO, pid)])
         
         if self.can_ron:
-            actions.append(Action(ActionType.RON, self.player_index))
+            actions.append(_CANONICAL_ACTIONS[(ActionType.RON, pid)])
         
         if self.can_riichi:
-            for idx in self.riichi_discard_indices:
-                actions.append(Action(ActionType.DECLARE_RIICHI, self.player_index, tile_index=idx))
+            actions.extend(Action(ActionType.DECLARE_RIICHI, pid, tile_index=idx)
+                           for idx in self.riichi_discard_indices)
         
         if self.can_discard:
-            for idx in self.discard_indices:
-                actions.append(Action(ActionType.DISCARD, self.player_index, tile_index=idx))
+            actions.extend(Action(ActionType.DISCARD, pid, tile_index=idx)
+                           for idx in self.discard_indices)
         
         if self.can_pon:
-            actions.append(Action(ActionType.PON, self.player_index))
+            actions.append(_CANONICAL_ACTIONS[(ActionType.PON, pid)])
         
         if self.can_kan:
-            actions.append(Action(ActionType.KAN, self.player_index))
+            actions.append(_CANONICAL_ACTIONS[(ActionType.KAN, pid)])
         
         if self.can_chi:
-            for opt in self.chi_options:
-                actions.append(Action(ActionType.CHI, self.player_index, chi_option=opt.option_index))
+            actions.extend(Action(ActionType.CHI, pid, chi_option=opt.option_index)
+                           for opt in self.chi_options)
         
         if self.can_pass:
-            actions.append(Action(ActionType.PASS, self.player_index))
+            actions.append(_CANONICAL_ACTIONS[(ActionType.PASS, pid)])
         
         return actions
 
@@ -269,11 +316,12 @@ class GameState:
         return self.players[self.active_player_index]
 
 
-@dataclass
+@dataclass(slots=True)
 class GameEvent:
     """
     Represents something that happened in the game.
-    Used for UI updates, logging, and replay.
+    Used for UI updates, logging, and replay. Slotted, as a game emits
+    hundreds of these.
     """
     event_type: GameEventType
     player_index: Optional[int] = None      # Which player is involved
@@ -281,7 +329,7 @@ class GameEvent:
     tiles: tuple = ()                       # Multiple tiles (for melds)
     message: str = ""                       # Human-readable description
     yaku: tuple = ()                        # Yaku list (for wins)
-    data: dict = field(default_factory=dict)  # Additional data
+    data: Optional[dict] = None             # Additional data (None if unused)
 
 
 # =============================================================================
@@ -313,28 +361,56 @@ def create_player_state(
         shanten_calc: ShantenCalculator instance
         include_hand: Whether to include the actual hand tiles (False for opponents)
     """
-    shanten = shanten_calc.calculate_shanten(player.hand)
-    waits = []
-    is_furiten = False
+    # Everything here only changes when the player does (mutation_seq), and
+    # get_state runs far more often than that, so the snapshots - shanten,
+    # waits and tile tuples included - are reused until the player moves on
+    cached = player.state_cache
+    if cached is None or cached[0] != player.mutation_seq or cached[1].index != index:
+        shanten, waits = shanten_calc.calculate_shanten_and_waits(player.hand)
+        is_furiten = False
+        
+        if shanten == 0:
+            # Check furiten
+            is_furiten = bool(tile_mask(waits) & player.discard_mask)
+        
+        full = PlayerState(
+            index=index,
+            name=player.name,
+            score=player.score,
+            is_riichi=player.is_riichi,
+            is_menzen=player.is_menzen,
+            hand=tiles_to_state(player.hand),
+            hand_size=len(player.hand),
+            discards=tiles_to_state(player.discards),
+            open_melds=tuple(player.open_melds),
+            shanten=shanten,
+            waits=tiles_to_state(waits),
+            is_furiten=is_furiten,
+            mutation_seq=player.mutation_seq
+        )
+        cached = player.state_cache = (player.mutation_seq, full, replace(full, hand=()))
     
-    if shanten == 0:
-        waits = shanten_calc.get_waits(player.hand)
-        # Check furiten
-        wait_ids = set((w.suit, w.value) for w in waits)
-        discard_ids = set((t.suit, t.value) for t in player.discards)
-        is_furiten = not wait_ids.isdisjoint(discard_ids)
+    return cached[1] if include_hand else cached[2]
+
+
+def create_player_states(
+    players,  # List of Player objects
+    shanten_calc,
+    for_player: int = None
+) -> tuple:
+    """
+    Create PlayerStates for all players in one pass.
     
-    return PlayerState(
-        index=index,
-        name=player.name,
-        score=player.score,
-        is_riichi=player.is_riichi,
-        is_menzen=player.is_menzen,
-        hand=tiles_to_state(player.hand) if include_hand else (),
-        hand_size=len(player.hand),
-        discards=tiles_to_state(player.discards),
-        open_melds=tuple(player.open_melds),
-        shanten=shanten,
-        waits=tiles_to_state(waits),
-        is_furiten=is_furiten
+    Args:
+        players: The Player objects, in seat order
+        shanten_calc: ShantenCalculator instance
+        for_player: If specified, only this player's hand is included.
+                    If None, all hands are included.
+    """
+    return tuple(
+        create_player_state(
+            p, i, shanten_calc,
+            include_hand=(for_player is None) or (i == for_player)
+        )
+        for i, p in enumerate(players)
     )
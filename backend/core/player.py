@@ -1,30 +1,71 @@
 from .tiles import Suit, Tile
+from .game_state import MeldState, tiles_to_state
 
 class Player:
+    __slots__ = ('name', 'hand', 'discards', 'discard_mask', 'open_melds', 'score', 'is_riichi',
+                 'mutation_seq', 'state_cache')
+
     def __init__(self, name):
         self.name = name
         self.hand = []
         self.discards = []
-        self.open_melds = [] # Stores active calls
+        self.discard_mask = 0 # Bit per tile kind ever discarded (see tile_mask), for furiten
+        self.open_melds = [] # Stores active calls (MeldState objects)
         
         # --- NEW ATTRIBUTES ---
         self.score = 25000       # Standard starting score
         self.is_riichi = False   # Is he or she in Riichi?
+        self.mutation_seq = 0    # Bumped on every change, so snapshots can be reused while it holds
+        self.state_cache = None  # (mutation_seq, PlayerStates) from create_player_state
+
+    def reset(self):
+        """Empty the hand, river and melds for a new game, keeping the list objects."""
+        self.hand.clear()
+        self.discards.clear()
+        self.discard_mask = 0
+        self.open_melds.clear()
+        self.score = 25000
+        self.is_riichi = False
+        self.mutation_seq += 1  # Keeps counting, so caches keyed on an old value miss
+
+    def snapshot(self):
+        """Copy with its own hand, river and meld lists (the tiles and melds are immutable)."""
+        p = Player.__new__(Player)
+        p.name = self.name
+        p.hand = list(self.hand)
+        p.discards = list(self.discards)
+        p.discard_mask = self.discard_mask
+        p.open_melds = list(self.open_melds)
+        p.score = self.score
+        p.is_riichi = self.is_riichi
+        p.mutation_seq = self.mutation_seq
+        p.state_cache = self.state_cache  # Immutable, and keyed by mutation_seq
+        return p
 
     def draw_tile(self, tile):
         if not tile: return
         self.hand.append(tile)
+        self.mutation_seq += 1
 
     def discard_tile(self, index):
         if 0 <= index < len(self.hand):
             tile = self.hand.pop(index)
             self.discards.append(tile)
+            self.discard_mask |= 1 << tile.index
             self.hand.sort()
+            self.mutation_seq += 1
             return tile
         return None
 
     def sort_hand(self):
         self.hand.sort()
+        self.mutation_seq += 1
+
+    def declare_riichi(self):
+        """Enter Riichi, paying the 1000 point deposit."""
+        self.is_riichi = True
+        self.score -= 1000
+        self.mutation_seq += 1
 
     def __repr__(self):
         # Show hand + melds
@@ -42,22 +83,23 @@ class Player:
         return sum(1 for t in self.hand if t == tile) >= 2
 
     # --- Call Execution ---
-    def execute_pon(self, tile: Tile):
+    def execute_pon(self, tile: Tile, called_from: int = -1):
         """
         Removes 2 matching tiles, creates a Pon meld.
         """
-        removed = 0
+        removed = []
         new_hand = []
         for t in self.hand:
             # Remove only the first 2 matches we find
-            if t == tile and removed < 2:
-                removed += 1
+            if t == tile and len(removed) < 2:
+                removed.append(t)
             else:
                 new_hand.append(t)
         
         self.hand = new_hand
-        # Store meld (For now, just a string representation)
-        self.open_melds.append(f"[Pon: {tile} {tile} {tile}]")
+        # The meld keeps the actual tiles, so a red five stays red (and only once)
+        self.open_melds.append(MeldState("pon", tiles_to_state(removed + [tile]), called_from))
+        self.mutation_seq += 1
         return True
     
     # --- Chi Detection ---
@@ -103,7 +145,7 @@ class Player:
             
         return options
 
-    def execute_chi(self, tile: Tile, indices):
+    def execute_chi(self, tile: Tile, indices, called_from: int = -1):
         """
         Removes the two tiles at the specified indices and forms a sequence meld.
         """
@@ -115,25 +157,27 @@ class Player:
         
         # Sort the meld components for display (e.g. 3,4,5)
         meld_tiles = sorted([t1, t2, tile])
-        self.open_melds.append(f"[Chi: {meld_tiles[0]} {meld_tiles[1]} {meld_tiles[2]}]")
+        self.open_melds.append(MeldState("chi", tiles_to_state(meld_tiles), called_from))
+        self.mutation_seq += 1
         return True
     
     def can_kan(self, tile: Tile):
         """Returns True if hand has 3 matches for the discard (Daiminkan)."""
         return sum(1 for t in self.hand if t == tile) == 3
 
-    def execute_kan(self, tile: Tile):
+    def execute_kan(self, tile: Tile, called_from: int = -1):
         """
         Removes 3 tiles, creates a Kan meld.
         """
-        removed = 0
+        removed = []
         new_hand = []
         for t in self.hand:
-            if t == tile and removed < 3:
-                removed += 1
+            if t == tile and len(removed) < 3:
+                removed.append(t)
             else:
                 new_hand.append(t)
         
         self.hand = new_hand
-        self.open_melds.append(f"[Kan: {tile} {tile} {tile} {tile}]")
+        self.open_melds.append(MeldState("kan", tiles_to_state(removed + [tile]), called_from))
+        self.mutation_seq += 1
         return True
\ No newline at end of file
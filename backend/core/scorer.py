@@ -1,49 +1,53 @@
 from .tiles import Suit, Tile
+from .shanten import to_frequency_table
 
 class Scorer:
     def __init__(self):
         pass
 
-    def check_yaku(self, hand, melds, is_riichi=False):
+    def check_yaku(self, hand, melds, is_riichi=False, counts=None):
         """
         Returns a list of Yaku names found in the hand.
         If list is empty, the hand is not a legal win (Kuitan/No Yaku).
+        
+        'counts' is the hand's 34-entry frequency table (see shanten.py):
+        callers that just built one for the shanten check pass it on here.
+        It is built from 'hand' if not given.
         """
         yaku_list = []
+        if counts is None:
+            counts = to_frequency_table(hand)
         
         # Merge hand and melds for checking certain Yaku
-        # Note: 'melds' in Player are strings currently. 
-        # For a real scorer, we need Melds to be objects or lists of Tiles.
-        # For this version, we will inspect the 'hand' (closed tiles) + simple assumption on melds.
+        # 'melds' are MeldState objects, so we can read their tiles directly.
         
         # 1. TANYAO (All Simples)
         # Condition: No Honours, No 1s, No 9s.
-        if self._is_tanyao(hand, melds):
+        if self._is_tanyao(counts, melds):
             yaku_list.append("Tanyao (All Simples)")
 
         # 2. YAKUHAI (Dragons)
         # Condition: Triplet of White, Green, or Red.
-        if self._is_yakuhai(hand, melds):
+        if self._is_yakuhai(counts, melds):
             yaku_list.append("Yakuhai (Dragons)")
             
         return yaku_list
 
-    def _is_tanyao(self, hand, melds):
-        # Check closed tiles
-        for tile in hand:
-            if tile.is_yaochuu: # defined in Tile class
-                return False
+    def _is_tanyao(self, counts, melds):
+        # Check closed tiles: no terminals (1/9 of each suit) and no honours (27-33)
+        if (counts[0] or counts[8] or counts[9] or counts[17] or
+                counts[18] or counts[26] or any(counts[27:34])):
+            return False
         
-        # Check melds (String parsing hack for now, ideally fix Meld structure)
-        # If string contains "1", "9", "East", "West", "Haku", etc.
-        # This is fragile but works for the current text-based implementation
+        # Check melds (tiles are TileState, so test suit/value directly)
         for m in melds:
-            if any(x in m for x in ["1", "9", "East", "South", "West", "North", "Haku", "Hatsu", "Chun"]):
-                return False
+            for t in m.tiles:
+                if t.suit == Suit.HONOUR or t.value in (1, 9):
+                    return False
                 
         return True
 
-    def _is_yakuhai(self, hand, melds):
+    def _is_yakuhai(self, counts, melds):
         # We need to count triplets. 
         # Since we don't have a full "Hand Partition" algorithm (decomposing hand into sets),
         # checking Yakuhai in a closed hand is tricky without the decomposition results.
@@ -52,21 +56,14 @@ class Scorer:
         # (This is slightly inaccurate because those 3 might be part of a sequence in rare cases, 
         # but Dragons cannot form sequences, so actually, this IS safe!)
         
-        dragons = ["Haku", "Hatsu", "Chun"]
-        
-        # Check closed hand
-        counts = {}
-        for tile in hand:
-            if tile.suit == Suit.HONOUR and tile.value in (5,6,7):
-                counts[tile.value] = counts.get(tile.value, 0) + 1
-        
-        for val, count in counts.items():
-            if count >= 3:
-                return True
+        # Check closed hand (31 = Haku, 32 = Hatsu, 33 = Chun)
+        if counts[31] >= 3 or counts[32] >= 3 or counts[33] >= 3:
+            return True
                 
-        # Check Melds
+        # Check Melds (only Pon/Kan can hold honours, Chi never does)
         for m in melds:
-            if any(d in m for d in dragons):
+            first = m.tiles[0]
+            if first.suit == Suit.HONOUR and first.value in (5, 6, 7):
                 return True
                 
         return False
\ No newline at end of file
@@ -1,24 +1,152 @@
+from collections import OrderedDict
+from operator import itemgetter
+
 from .tiles import Suit, Tile, Rank, Honour
 
+# Standard shanten contribution of a single numbered suit, keyed by bytes of its
+# 9 counts. Shared by every ShantenCalculator and filled on first use of each shape.
+_SUIT_TABLE = {}
+
+# Entries kept in each per-calculator shanten / waits LRU cache
+_CACHE_SIZE = 4096
+
+# Pulls the 13 terminal and honour counts out of a frequency table in one call
+_get_yaochuu = itemgetter(0, 8, 9, 17, 18, 26, 27, 28, 29, 30, 31, 32, 33)
+
+# One tile on each of three consecutive ranks, in packed (3 bits per rank) form
+_RUN = 1 | (1 << 3) | (1 << 6)
+
+# Bit i is set if a run can start on rank i+1 of a suit (1-7, not 8 or 9)
+_RUN_START_MASK = 0b001111111
+
+
+def to_frequency_table(tiles):
+    """
+    Converts a list of Tiles into a 34-entry count table. It is a bytearray:
+    counts never exceed 4, and bytes(counts) is a cheap hashable key.
+    
+    Index Mapping:
+    0-8:   Man 1-9
+    9-17:  Pin 1-9
+    18-26: Sou 1-9
+    27-33: Honours (East, S, W, N, W, G, R)
+    """
+    counts = bytearray(34)
+    for t in tiles:
+        counts[t.index] += 1
+    return counts
+
+
+def encode_hand(tiles):
+    """
+    Encodes a hand as one int holding 3 bits per tile kind (frequency-table
+    order). Adding or removing a tile is just +/- (1 << 3 * tile.index), and
+    the int is hashable, so simulations can keep hands in this form and pass
+    them straight to ShantenCalculator.
+    """
+    hand = 0
+    for t in tiles:
+        hand += 1 << (3 * t.index)
+    return hand
+
+
+def _decode_hand(hand):
+    """Frequency table for a hand produced by encode_hand."""
+    counts = bytearray(34)
+    i = 0
+    while hand:
+        counts[i] = hand & 7
+        hand >>= 3
+        i += 1
+    return counts
+
+
+def pack_counts(suit_counts):
+    """
+    Packs a suit's 9 counts (0-4 each) into one int, 3 bits per rank with
+    rank 1 in the lowest bits. Removing a triplet or run is then a single
+    subtraction and the packed value doubles as a hash key.
+    """
+    packed = 0
+    for c in reversed(suit_counts):
+        packed = (packed << 3) | c
+    return packed
+
+
+def _standard_bound(tiles, ahead):
+    """
+    Lowest score a suit search can still reach: sets (-2 per 3 tiles) beat
+    pairs/partials (-1 per 2 tiles), so assume every possible set is made
+    from the 'ahead' tiles and the rest all pair up. Never above the real
+    best, so branches that can't beat it are safe to prune.
+    """
+    sets = ahead // 3
+    return -2 * sets - (tiles - 3 * sets) // 2
+
+
+def _cache_get(cache, key):
+    """LRU lookup: returns None on a miss, otherwise marks the entry as recent."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache, key, value):
+    cache[key] = value
+    if len(cache) > _CACHE_SIZE:
+        cache.popitem(last=False)
+
+
 class ShantenCalculator:
     def __init__(self):
         self.MAX_SHANTEN = 8
+        self._memo = {}  # packed counts + index -> best score, per standard search
+        # Recently seen hands, keyed by bytes of the frequency table
+        self._shanten_cache = OrderedDict()
+        self._waits_cache = OrderedDict()
 
-    def calculate_shanten(self, hand_tiles):
+    def calculate_shanten(self, hand_tiles, at_most=None):
         """
         Main entry point. Returns the minimum shanten of all 3 patterns.
+
+        Callers that only ask "is it at most N?" (e.g. tenpai checks) can
+        pass at_most=N: the result is exact when it is <= N, otherwise it is
+        just some value above N, which lets the search stop early.
         """
         # 1. Convert List[Tile] -> Frequency Array (Indices 0-33)
         counts = self._to_frequency_table(hand_tiles)
-        return self._calculate_from_counts(counts)
+        return self._calculate_from_counts(counts, at_most)
 
     def get_waits(self, hand_tiles):
         """
         Returns a list of Tile objects that would complete the hand.
         Only accurate if the hand is Tenpai (0-shanten).
         """
-        waits = []
         counts = self._to_frequency_table(hand_tiles)
+        return self._get_waits_from_counts(counts)
+
+    def calculate_shanten_and_waits(self, hand_tiles):
+        """
+        Returns (shanten, waits) for a hand, building the frequency table once.
+        Waits are only computed when the hand is Tenpai, otherwise empty.
+        """
+        counts = self._to_frequency_table(hand_tiles)
+        shanten = self._calculate_from_counts(counts)
+        if shanten != 0:
+            return shanten, []
+        return shanten, self._get_waits_from_counts(counts)
+
+    # --- Internal Helpers ---
+    
+    def _get_waits_from_counts(self, counts):
+        """Returns the winning tiles for a frequency table (modified in place, then restored)."""
+        key = bytes(counts)
+        cached = _cache_get(self._waits_cache, key)
+        if cached is not None:
+            return list(cached)
+
+        waits = []
         
         # Iterate through every possible tile index (0-33)
         for i in range(34):
@@ -27,135 +155,198 @@ class ShantenCalculator:
                 counts[i] += 1
                 
                 # Check if this makes the hand a winner (-1 shanten)
-                if self._calculate_from_counts(counts) == -1:
+                if self._calculate_from_counts(counts, -1) == -1:
                     waits.append(self._index_to_tile(i))
                 
                 # Backtrack (remove the imaginary tile)
                 counts[i] -= 1
                 
+        _cache_put(self._waits_cache, key, tuple(waits))
         return waits
 
-    # --- Internal Helpers ---
-    
-    def _calculate_from_counts(self, counts):
-        """Calculates shanten from a frequency table."""
-        s_standard = self._get_standard_shanten(counts)
+    def _calculate_from_counts(self, counts, at_most=None):
+        """Calculates shanten from a frequency table (see calculate_shanten for at_most)."""
+        key = bytes(counts)
+        cached = _cache_get(self._shanten_cache, key)
+        if cached is not None:
+            return cached
+
         s_chitoi   = self._get_chitoitsu_shanten(counts)
         s_kokushi  = self._get_kokushi_shanten(counts)
-        return min(s_standard, s_chitoi, s_kokushi)
+        shanten = min(s_chitoi, s_kokushi)
+        # A hand of at most 14 tiles can't score below -1 on the standard
+        # pattern, so a complete seven pairs / kokushi makes the search moot
+        if shanten > -1:
+            beat = shanten if at_most is None else min(shanten, at_most + 1)
+            s_standard = self._get_standard_shanten(counts, beat)
+            if s_standard >= beat and beat < shanten:
+                # Only known to be above at_most, so don't cache it
+                return min(shanten, s_standard)
+            shanten = min(shanten, s_standard)
+        _cache_put(self._shanten_cache, key, shanten)
+        return shanten
 
     def _to_frequency_table(self, tiles):
-        # Index Mapping:
-        # 0-8:   Man 1-9
-        # 9-17:  Pin 1-9
-        # 18-26: Sou 1-9
-        # 27-33: Honours (East, S, W, N, W, G, R)
-        counts = [0] * 34
-        for t in tiles:
-            index = -1
-            if t.suit == Suit.MAN: index = t.value - 1
-            elif t.suit == Suit.PIN: index = 9 + (t.value - 1)
-            elif t.suit == Suit.SOU: index = 18 + (t.value - 1)
-            elif t.suit == Suit.HONOUR: index = 27 + (t.value - 1)
-            
-            if 0 <= index < 34:
-                counts[index] += 1
-        return counts
+        # Every public method takes a list of Tiles, an encode_hand int or a
+        # to_frequency_table table (so callers can share one with the Scorer)
+        if isinstance(tiles, int):
+            return _decode_hand(tiles)
+        if isinstance(tiles, bytearray):
+            return tiles
+        return to_frequency_table(tiles)
 
     def _index_to_tile(self, index):
         """Reconstructs a Tile object from a frequency index."""
         if 0 <= index < 9:
-            return Tile(Suit.MAN, index + 1)
+            return Tile.get(Suit.MAN, index + 1)
         elif 9 <= index < 18:
-            return Tile(Suit.PIN, index - 9 + 1)
+            return Tile.get(Suit.PIN, index - 9 + 1)
         elif 18 <= index < 27:
-            return Tile(Suit.SOU, index - 18 + 1)
+            return Tile.get(Suit.SOU, index - 18 + 1)
         elif 27 <= index < 34:
-            return Tile(Suit.HONOUR, index - 27 + 1)
+            return Tile.get(Suit.HONOUR, index - 27 + 1)
         return None
 
     # --- Logic 1: Seven Pairs (Chitoitsu) ---
     def _get_chitoitsu_shanten(self, counts):
-        pairs = 0
-        unique_tiles = 0
-        for c in counts:
-            if c >= 2: pairs += 1
-            if c >= 1: unique_tiles += 1
+        # Counts are 0-4, so list.count does both scans at C speed
+        empty = counts.count(0)
+        unique_tiles = 34 - empty
+        pairs = unique_tiles - counts.count(1)
         return 6 - pairs + max(0, 7 - unique_tiles)
 
     # --- Logic 2: Thirteen Orphans (Kokushi Musou) ---
     def _get_kokushi_shanten(self, counts):
-        yaochuu_indices = [0, 8, 9, 17, 18, 26] + list(range(27, 34))
-        unique_count = 0
-        has_pair = False
-        for idx in yaochuu_indices:
-            if counts[idx] > 0:
-                unique_count += 1
-            if counts[idx] >= 2:
-                has_pair = True
+        yaochuu = _get_yaochuu(counts)
+        unique_count = 13 - yaochuu.count(0)
+        has_pair = unique_count > yaochuu.count(1)
         return 13 - unique_count - (1 if has_pair else 0)
 
     # --- Logic 3: Standard (4 Sets + 1 Pair) ---
-    def _get_standard_shanten(self, counts):
-        return self._recurse_standard(counts, 0)
+    def _get_standard_shanten(self, counts, beat=99):
+        """
+        Sets, partial sets and pairs never cross a suit boundary, so each suit
+        is scored on its own and the results are summed.
+        Every set lowers shanten by 2, every partial set or pair by 1.
 
-    def _recurse_standard(self, counts, index):
-        while index < 34 and counts[index] == 0:
-            index += 1
-        
-        if index >= 34:
-            return self._calculate_final_standard_shanten(counts)
+        Only a result below 'beat' matters to the caller: once that is out of
+        reach the remaining suits aren't searched and a lower bound that is
+        still >= 'beat' is returned instead.
+        """
+        shanten = 8 + self._get_honour_standard_shanten(counts[27:34])
+
+        # Suits already in the table cost nothing, so take those first
+        unknown = []
+        for start in (0, 9, 18):
+            suit_counts = counts[start:start + 9]
+            score = _SUIT_TABLE.get(bytes(suit_counts))
+            if score is None:
+                unknown.append(suit_counts)
+            else:
+                shanten += score
+        if not unknown:
+            return shanten
+
+        # Search the richest suit first: it moves the total the most, so the
+        # bound on whatever is left tightens fastest
+        sizes = sorted((sum(c), c) for c in unknown)
+        rest_bound = sum(_standard_bound(n, n) for n, _ in sizes)
+        while sizes:
+            if shanten + rest_bound >= beat:
+                return shanten + rest_bound
+            n, suit_counts = sizes.pop()
+            rest_bound -= _standard_bound(n, n)
+            shanten += self._get_suit_standard_shanten(suit_counts)
+        return shanten
+
+    def _get_suit_standard_shanten(self, suit_counts):
+        """Best (most negative) contribution of one numbered suit (9 counts)."""
+        key = bytes(suit_counts)
+        score = _SUIT_TABLE.get(key)
+        if score is None:
+            self._memo.clear()
+            tiles = sum(suit_counts)
+            score = self._recurse_standard(pack_counts(suit_counts), 0, tiles, tiles)
+            _SUIT_TABLE[key] = score
+        return score
+
+    def _get_honour_standard_shanten(self, honour_counts):
+        """Honours can't form runs, so each one is a triplet, a pair or nothing."""
+        score = 0
+        for c in honour_counts:
+            if c >= 3:
+                score -= 2
+            elif c == 2:
+                score -= 1
+        return score
 
+    def _recurse_standard(self, packed, index, tiles, ahead):
+        """
+        Best score for the rest of a suit. 'tiles' is the number of tiles left
+        in the suit and 'ahead' how many of them sit on rank 'index' or above
+        (only those can still form sets; skipped ones can only pair up).
+        """
+        # Jump straight to the next non-empty rank: the lowest set bit of the
+        # remaining lanes tells us which 3-bit lane it sits in.
+        rest = packed >> (3 * index)
+        if not rest:
+            return self._calculate_final_standard_shanten(packed)
+        index += ((rest & -rest).bit_length() - 1) // 3
+
+        # Different extraction orders can reach the same counts (e.g. 111222333
+        # as three triplets or three runs). The key covers the whole suit because
+        # skipped tiles below 'index' still count as pairs/partials at the end.
+        key = packed | (index << 27)
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
+        shift = 3 * index
+        count = (packed >> shift) & 7
         best_score = 99
         
         # 1. Try Set (Triplet)
-        if counts[index] >= 3:
-            counts[index] -= 3
-            best_score = min(best_score, self._recurse_standard(counts, index) - 2)
-            counts[index] += 3 
-
-        # 2. Try Run (Sequence)
-        if index < 27 and index % 9 < 7:
-            if counts[index] >= 1 and counts[index+1] >= 1 and counts[index+2] >= 1:
-                counts[index] -= 1
-                counts[index+1] -= 1
-                counts[index+2] -= 1
-                best_score = min(best_score, self._recurse_standard(counts, index) - 2)
-                counts[index] += 1
-                counts[index+1] += 1
-                counts[index+2] += 1 
+        if count >= 3:
+            best_score = self._recurse_standard(packed - (3 << shift), index, tiles - 3, ahead - 3) - 2
+            # Already as good as this frame can possibly get
+            if best_score == _standard_bound(tiles, ahead):
+                self._memo[key] = best_score
+                return best_score
+
+        # 2. Try Run (Sequence), unless even a perfect finish can't beat best_score
+        if (_RUN_START_MASK >> index & 1 and (packed >> (shift + 3)) & 7 and (packed >> (shift + 6)) & 7
+                and _standard_bound(tiles - 3, ahead - 3) - 2 < best_score):
+            best_score = min(best_score, self._recurse_standard(packed - (_RUN << shift), index, tiles - 3, ahead - 3) - 2)
 
         # 3. Skip
-        best_score = min(best_score, self._recurse_standard(counts, index + 1))
+        if _standard_bound(tiles, ahead - count) < best_score:
+            best_score = min(best_score, self._recurse_standard(packed, index + 1, tiles, ahead - count))
+        self._memo[key] = best_score
         return best_score
 
-    def _calculate_final_standard_shanten(self, counts):
+    def _calculate_final_standard_shanten(self, packed):
+        """Scores the tiles left in a suit: -1 per pair and per partial set."""
         pairs = 0
         taatsu = 0 
         
-        temp_counts = list(counts) 
+        temp_counts = [(packed >> (3 * i)) & 7 for i in range(9)]
         
-        for i in range(34):
+        for i in range(9):
             if temp_counts[i] >= 2:
                 pairs += 1
                 temp_counts[i] -= 2
         
-        for i in range(27): 
+        for i in range(9): 
             if temp_counts[i] > 0:
                 # Neighbours (e.g. 2m 3m)
-                if i % 9 < 8 and temp_counts[i+1] > 0:
+                if i < 8 and temp_counts[i+1] > 0:
                     taatsu += 1
                     temp_counts[i] -= 1
                     temp_counts[i+1] -= 1
                 # Kanchan (e.g. 2m 4m)
-                elif i % 9 < 7 and temp_counts[i+2] > 0:
+                elif i < 7 and temp_counts[i+2] > 0:
                     taatsu += 1
                     temp_counts[i] -= 1
                     temp_counts[i+2] -= 1
 
-        potential_sets = taatsu
-        if pairs > 0:
-            potential_sets += (pairs - 1)
-            return 8 - potential_sets - 1 
-        else:
-             return 8 - potential_sets
\ No newline at end of file
+        return -(taatsu + pairs)
@@ -0,0 +1,50 @@
+import random
+
+from core.game_engine import GameEngine
+from core.game_state import GamePhase, Action, ActionType
+
+
+class TestEngine:
+    def setup_method(self):
+        random.seed(0)  # Same wall, and so the same game, on every run
+        self.engine = GameEngine()
+        self.engine.setup()
+
+    def _hands(self, engine):
+        return [list(p.hand) for p in engine.players]
+
+    def test_snapshot_is_independent(self):
+        """Moving a snapshot leaves the original untouched, and vice versa"""
+        engine = self.engine
+        before = (self._hands(engine), engine.wall.remaining, engine.phase)
+
+        fork = engine.snapshot()
+        fork.advance_to_next_decision()
+        assert fork.phase == GamePhase.DISCARD
+        fork.apply_action(Action(ActionType.DISCARD, fork.active_player_index, tile_index=0))
+        assert (self._hands(engine), engine.wall.remaining, engine.phase) == before
+
+        # The original can still play on without disturbing the fork
+        fork_hands = self._hands(fork)
+        engine.advance_to_next_decision()
+        assert len(engine.players[0].hand) == 14
+        assert self._hands(fork) == fork_hands
+
+    def test_reset(self):
+        """A reset engine plays a fresh game from a full wall"""
+        engine = self.engine
+        while not engine.is_game_over:
+            if engine.is_draw_phase:
+                engine.advance_to_next_decision()
+            if engine.is_game_over:
+                break
+            engine.apply_action(engine.get_state().available_actions.get_actions()[0])
+
+        engine.reset()
+        assert engine.phase == GamePhase.SETUP
+        assert engine.wall.remaining == 122
+        assert all(not p.hand and not p.discards and not p.open_melds for p in engine.players)
+
+        engine.setup()
+        assert [len(p.hand) for p in engine.players] == [13] * 4
+        assert engine.wall.remaining == 122 - 52
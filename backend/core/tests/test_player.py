@@ -0,0 +1,34 @@
+from core.player import Player
+from core.tiles import Tile, Suit
+
+
+def t(suit, value, is_red=False):
+    return Tile.get(suit, value, is_red)
+
+
+class TestPlayer:
+    def setup_method(self):
+        self.player = Player("P")
+
+    def _meld_reds(self):
+        return [ts.is_red for ts in self.player.open_melds[-1].tiles]
+
+    def test_pon_keeps_red_five_from_hand(self):
+        """Calling a plain 5m with a red 5m in hand moves the red five into the meld"""
+        self.player.hand = [t(Suit.MAN, 5, True), t(Suit.MAN, 5), t(Suit.PIN, 1)]
+        self.player.execute_pon(t(Suit.MAN, 5))
+        assert self.player.hand == [t(Suit.PIN, 1)]
+        assert sorted(self._meld_reds()) == [False, False, True]
+
+    def test_pon_of_red_five(self):
+        """Calling a red 5m records one red five, not three"""
+        self.player.hand = [t(Suit.MAN, 5), t(Suit.MAN, 5), t(Suit.PIN, 1)]
+        self.player.execute_pon(t(Suit.MAN, 5, True))
+        assert sorted(self._meld_reds()) == [False, False, True]
+
+    def test_kan_keeps_red_five_from_hand(self):
+        """Same for a called kan"""
+        self.player.hand = [t(Suit.SOU, 5), t(Suit.SOU, 5, True), t(Suit.SOU, 5)]
+        self.player.execute_kan(t(Suit.SOU, 5))
+        assert self.player.hand == []
+        assert sorted(self._meld_reds()) == [False, False, False, True]
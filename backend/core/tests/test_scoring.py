@@ -1,6 +1,7 @@
 import pytest
 from core.scorer import Scorer
 from core.tiles import Tile, Suit, Rank, Honour
+from core.game_state import MeldState, tiles_to_state
 
 # Helper to create tiles quickly
 def t(suit, value):
@@ -41,6 +42,21 @@ class TestScoring:
         yaku_list = self.scorer.check_yaku(hand, melds=[])
         assert any("yakuhai" in y.lower() for y in yaku_list)
 
+    def test_open_melds(self):
+        """Test yaku checks read the tiles of open melds"""
+        # Hand: 234m 345p 567s 88s + open Pon of White Dragon
+        hand = [
+            t(Suit.MAN, 2), t(Suit.MAN, 3), t(Suit.MAN, 4),
+            t(Suit.PIN, 3), t(Suit.PIN, 4), t(Suit.PIN, 5),
+            t(Suit.SOU, 5), t(Suit.SOU, 6), t(Suit.SOU, 7),
+            t(Suit.SOU, 8), t(Suit.SOU, 8)
+        ]
+        melds = [MeldState("pon", tiles_to_state([t(Suit.HONOUR, 5)] * 3), called_from=1)]
+        
+        yaku_list = self.scorer.check_yaku(hand, melds=melds)
+        assert any("yakuhai" in y.lower() for y in yaku_list)
+        assert not any("tanyao" in y.lower() for y in yaku_list)
+
     @pytest.mark.skip(reason="Logic not yet implemented in scorer.py")
     def test_pinfu(self):
         """Test pinfu (all sequences, no fu)"""
@@ -0,0 +1,85 @@
+from core.shanten import ShantenCalculator, encode_hand, to_frequency_table
+from core.tiles import Tile, Suit
+
+# Helper to create tiles quickly
+def t(suit, value):
+    return Tile(suit, value)
+
+def suit_tiles(suit, values):
+    return [t(suit, v) for v in values]
+
+class TestShanten:
+    def setup_method(self):
+        self.calc = ShantenCalculator()
+
+    def test_complete_hand(self):
+        """4 sets + 1 pair is a winning shape (-1)"""
+        # Hand: 123m 456m 789m 111p 55s
+        hand = (suit_tiles(Suit.MAN, [1, 2, 3, 4, 5, 6, 7, 8, 9]) +
+                suit_tiles(Suit.PIN, [1, 1, 1]) +
+                suit_tiles(Suit.SOU, [5, 5]))
+        assert self.calc.calculate_shanten(hand) == -1
+
+    def test_tenpai_and_waits(self):
+        """123m 456m 789m 11p 23s waits on 1s/4s (ryanmen)"""
+        hand = (suit_tiles(Suit.MAN, [1, 2, 3, 4, 5, 6, 7, 8, 9]) +
+                suit_tiles(Suit.PIN, [1, 1]) +
+                suit_tiles(Suit.SOU, [2, 3]))
+        assert self.calc.calculate_shanten(hand) == 0
+        waits = [(w.suit, w.value) for w in self.calc.get_waits(hand)]
+        assert (Suit.SOU, 1) in waits
+        assert (Suit.SOU, 4) in waits
+
+    def test_sets_do_not_cross_suits(self):
+        """8m 9m 1p is not a run"""
+        hand = (suit_tiles(Suit.MAN, [8, 9]) + suit_tiles(Suit.PIN, [1]) +
+                suit_tiles(Suit.SOU, [1, 2, 3, 4, 5, 6, 7, 8, 9]) +
+                [t(Suit.HONOUR, 1), t(Suit.HONOUR, 1)])
+        assert self.calc.calculate_shanten(hand) == 0
+
+    def test_chitoitsu(self):
+        """Seven pairs"""
+        hand = (suit_tiles(Suit.MAN, [1, 1, 4, 4]) +
+                suit_tiles(Suit.PIN, [2, 2, 8, 8]) +
+                suit_tiles(Suit.SOU, [6, 6]) +
+                [t(Suit.HONOUR, 1), t(Suit.HONOUR, 1), t(Suit.HONOUR, 7), t(Suit.HONOUR, 7)])
+        assert self.calc.calculate_shanten(hand) == -1
+
+    def test_kokushi(self):
+        """Thirteen orphans with a pair of Chun"""
+        hand = (suit_tiles(Suit.MAN, [1, 9]) + suit_tiles(Suit.PIN, [1, 9]) +
+                suit_tiles(Suit.SOU, [1, 9]) +
+                [t(Suit.HONOUR, v) for v in range(1, 8)] + [t(Suit.HONOUR, 7)])
+        assert self.calc.calculate_shanten(hand) == -1
+
+    def test_at_most(self):
+        """at_most keeps results within the bound exact and only reports 'worse' above it"""
+        # 123m 456m 11p 23s 58s East: 2-shanten
+        hand = (suit_tiles(Suit.MAN, [1, 2, 3, 4, 5, 6]) +
+                suit_tiles(Suit.PIN, [1, 1]) +
+                suit_tiles(Suit.SOU, [2, 3, 5, 8]) + [t(Suit.HONOUR, 1)])
+        exact = self.calc.calculate_shanten(hand)
+        assert exact == 2
+        assert ShantenCalculator().calculate_shanten(hand, at_most=1) > 1
+        assert ShantenCalculator().calculate_shanten(hand, at_most=2) == 2
+
+    def test_encoded_hand(self):
+        """An encode_hand int gives the same answers as the tile list"""
+        hand = (suit_tiles(Suit.MAN, [1, 2, 3, 4, 5, 6, 7, 8, 9]) +
+                suit_tiles(Suit.PIN, [1, 1]) +
+                suit_tiles(Suit.SOU, [2, 3]))
+        encoded = encode_hand(hand)
+        assert self.calc.calculate_shanten(encoded) == 0
+        assert self.calc.get_waits(encoded) == self.calc.get_waits(hand)
+        # Drawing 4s completes it
+        assert self.calc.calculate_shanten(encoded + encode_hand([t(Suit.SOU, 4)])) == -1
+
+    def test_frequency_table(self):
+        """A to_frequency_table table is accepted as-is, and left unchanged"""
+        hand = (suit_tiles(Suit.MAN, [1, 2, 3, 4, 5, 6, 7, 8, 9]) +
+                suit_tiles(Suit.PIN, [1, 1]) +
+                suit_tiles(Suit.SOU, [2, 3]))
+        counts = to_frequency_table(hand)
+        assert self.calc.calculate_shanten(counts) == 0
+        assert self.calc.get_waits(counts) == self.calc.get_waits(hand)
+        assert counts == to_frequency_table(hand)
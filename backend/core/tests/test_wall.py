@@ -0,0 +1,40 @@
+import random
+
+from core.wall import Wall
+
+
+class TestWall:
+    def setup_method(self):
+        self.wall = Wall()
+
+    def test_live_wall_size(self):
+        """136 tiles minus the 14-tile dead wall"""
+        assert self.wall.remaining == 122
+        for _ in range(122):
+            assert self.wall.draw() is not None
+        assert self.wall.remaining == 0
+        assert self.wall.draw() is None
+
+    def test_kan_dora_after_replacements(self):
+        """No dora indicator is ever a tile drawn as a replacement"""
+        dead_start = len(self.wall.tiles) - 14
+        indicator_positions = [len(self.wall.tiles) - 1]
+        replacement_positions = []
+        for i in range(4):
+            assert self.wall.draw_replacement() is self.wall.tile_at(dead_start + i)
+            replacement_positions.append(dead_start + i)
+            self.wall.reveal_kan_dora()
+            indicator_positions.append(len(self.wall.tiles) - 3 - 2 * i)
+        assert self.wall.draw_replacement() is None
+        assert len(self.wall.dora_indicators) == 5
+        assert self.wall.dora_indicators == [self.wall.tile_at(p) for p in indicator_positions]
+        assert not set(indicator_positions) & set(replacement_positions)
+        assert all(dead_start <= p for p in indicator_positions)
+
+    def test_reset_matches_fresh_wall(self):
+        """A reset wall deals the same tiles as a new one for the same seed"""
+        random.seed(1)
+        fresh = Wall()
+        random.seed(1)
+        self.wall.reset()
+        assert self.wall.tiles == fresh.tiles
@@ -37,12 +37,44 @@ class Honour(IntEnum):
     HATSU = 6
     CHUN = 7
     
+# First frequency-table index of each suit, indexed by Suit value (0 is unused)
+SUIT_BASE = (0, 0, 9, 18, 27)
+
+# Shared Tile instances keyed by (suit, value, is_red), see Tile.get
+_TILE_POOL = {}
+
 class Tile:
+    __slots__ = ('suit', 'value', 'is_red', 'id', 'index')
+
     def __init__(self, suit: Suit, value: int, is_red: bool = False):
         self.suit = suit
         self.value = value
         self.is_red = is_red # Needed for "Akadora" (Red Fives)
         self.id = f"{value}_{suit.name}{'_RED' if is_red else ''}"
+        self.index = SUIT_BASE[suit] + value - 1 # 0-33, ignores red
+
+    @classmethod
+    def get(cls, suit: Suit, value: int, is_red: bool = False):
+        """
+        Returns the shared instance for this tile. There are only 37 distinct
+        tiles (34 kinds + 3 red fives), so decks and hands can all reference
+        the same objects instead of allocating new ones.
+        """
+        key = (suit, value, is_red)
+        tile = _TILE_POOL.get(key)
+        if tile is None:
+            tile = _TILE_POOL[key] = cls(Suit(suit), int(value), is_red)
+        return tile
+
+    # Tiles are immutable, so copies (e.g. engine.clone()) can share them
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (Tile.get, (self.suit, self.value, self.is_red))
     
     # Returns a short string like "1m", "5p_red", "East" for debugging.
     def __repr__(self):
@@ -77,14 +109,16 @@ class Tile:
         return self.is_red and not other.is_red
 
     def __eq__(self, other):
+        # Tiles are equal by kind: a red five is still a five for calls,
+        # furiten and hand checks. Use is_red where akadora matters.
+        if self is other:
+            return True
         if not isinstance(other, Tile):
             return False
-        return (self.suit == other.suit and 
-                self.value == other.value and 
-                self.is_red == other.is_red)
+        return self.index == other.index
     
     def __hash__(self):
-        return hash(self.id)
+        return self.index
     
     @property
     def is_honour(self):
@@ -102,6 +136,14 @@ class Tile:
         return self.is_terminal or self.is_honour
     
 
+def tile_mask(tiles):
+    """Returns a 34-bit int with bit 'tile.index' set for every tile kind present."""
+    mask = 0
+    for t in tiles:
+        mask |= 1 << t.index
+    return mask
+
+
 def create_standard_deck(akadora=True):
     deck = []
 
@@ -113,17 +155,17 @@ def create_standard_deck(akadora=True):
             
             # Handle Red Fives
             if akadora and val == 5:
-                deck.append(Tile(suit, val, is_red=True))
+                deck.append(Tile.get(suit, val, is_red=True))
                 count = 3
             
             for _ in range(count):
-                deck.append(Tile(suit, val))
+                deck.append(Tile.get(suit, val))
 
     # 2. Honours (East..Chun)
     for honour in Honour: # Iterate over 1-7
         val = honour.value
         for _ in range(4):
-            deck.append(Tile(Suit.HONOUR, val))
+            deck.append(Tile.get(Suit.HONOUR, val))
 
     return deck
 
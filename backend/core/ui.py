@@ -3,13 +3,21 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 from rich import box
-from .tiles import Suit
+from .tiles import Suit, tile_mask
 
 console = Console()
 
+# Rendered tiles keyed by tile.id; there are only 37 distinct tiles
+_STYLE_CACHE = {}
+
 def get_tile_style(tile):
     """Returns a Rich Text object with full names (e.g. '5 Sou')."""
     if not tile: return Text("??", style="dim")
+
+    # Hand out copies, since callers append to the Text they get back
+    cached = _STYLE_CACHE.get(tile.id)
+    if cached is not None:
+        return cached.copy()
     
     # 1. Define Colors
     color_map = {
@@ -52,7 +60,9 @@ def get_tile_style(tile):
         style = "bold red underline"
     
     # Return formatted text in brackets e.g. [5 Sou]
-    return Text(f"[{text_content}]", style=style)
+    text = Text(f"[{text_content}]", style=style)
+    _STYLE_CACHE[tile.id] = text
+    return text.copy()
 
 def render_hand(player, show_indices=False):
     """Renders the player's hand as a nice row."""
@@ -149,7 +159,7 @@ def print_dashboard(game, active_player_index):
         console.print(Text(f"Melds: {me.open_melds}", style="yellow"))
 
     # --- Status Calculation ---
-    shanten = game.shanten_calc.calculate_shanten(me.hand)
+    shanten, waits = game.shanten_calc.calculate_shanten_and_waits(me.hand)
     
     status_line = Text(f"Score: {me.score}   ", style="bold white")
 
@@ -159,14 +169,8 @@ def print_dashboard(game, active_player_index):
     
     # Add Tenpai/Waits Badge
     if shanten == 0:
-        # Calculate Waits
-        waits = game.shanten_calc.get_waits(me.hand)
-        
         # --- NEW: Check Furiten for UI ---
-        wait_ids = set((w.suit, w.value) for w in waits)
-        discard_ids = set((t.suit, t.value) for t in me.discards)
-        
-        is_furiten = not wait_ids.isdisjoint(discard_ids)
+        is_furiten = bool(tile_mask(waits) & me.discard_mask)
         
         if is_furiten:
             status_line.append("[ FURITEN ] ", style="bold white on red")
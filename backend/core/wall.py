@@ -1,41 +1,85 @@
+import copy
 import random
+from array import array
 from .tiles import create_standard_deck  # Import the function from your tile file
 
+def _build_codes(deck):
+    # Number the distinct (pooled) tiles in deck order: 34 kinds + 3 red fives
+    codes = {}
+    for t in deck:
+        codes.setdefault((t.suit, t.value, t.is_red), (len(codes), t))
+    decode = tuple(t for _, t in codes.values())
+    return decode, array('B', (codes[(t.suit, t.value, t.is_red)][0] for t in deck))
+
 class Wall:
+    # The wall is stored as one byte per tile, a code into _DECODE, rather
+    # than a list of Tile references. Every wall shuffles a copy of the same
+    # prototype, and copying it is a 136-byte memcpy.
+    _DECODE, _PROTOTYPE_CODES = _build_codes(create_standard_deck())
+
     def __init__(self):
-        self.tiles = create_standard_deck()
+        self.tiles = array('B')
+        # Set once snapshot() has shared self.tiles with another wall
+        self._tiles_shared = False
+        self.reset()
+        
+    def reset(self):
+        """Shuffle for a new game, reusing the tile list unless a snapshot shares it."""
+        if self._tiles_shared:
+            self.tiles = array('B', self._PROTOTYPE_CODES)
+            self._tiles_shared = False
+        else:
+            # Shuffle from the prototype order, not the last game's, so a
+            # given random seed deals the same wall as a fresh Wall()
+            self.tiles[:] = self._PROTOTYPE_CODES
         random.shuffle(self.tiles)
         
-        # The Dead Wall (Wangpai) is the last 14 tiles.
-        self.dead_wall = self.tiles[-14:] 
-        self.tiles = self.tiles[:-14]
+        # The Dead Wall (Wangpai) is the last 14 tiles. Both walls are views
+        # into self.tiles via cursors, so nothing is sliced or popped.
+        # Within the dead wall, the 4 replacement (rinshan) tiles are the
+        # first 4, drawn upwards, and the dora indicators are counted from
+        # the far end, so a revealed indicator is never a drawn tile.
+        self._dead_start = len(self.tiles) - 14
+        self._replacement = self._dead_start
+        # The live wall is tiles[:remaining], drawn from the end inwards, so
+        # the draw cursor doubles as the tile count
+        self.remaining = self._dead_start
         
         # Dora Indicators: start with 1 visible
-        self.dora_indicators = [self.dead_wall[5]] 
+        self.dora_indicators = [self.tile_at(-1)]
+        
+    def snapshot(self):
+        """Copy for a simulation branch. The shuffled tiles are only written by reset(), so they're shared."""
+        self._tiles_shared = True
+        wall = copy.copy(self)
+        wall.dora_indicators = list(self.dora_indicators)
+        return wall
+        
+    def tile_at(self, position):
+        """The Tile at a position in the wall (self.tiles holds codes)."""
+        return self._DECODE[self.tiles[position]]
         
     def draw(self):
-        if not self.tiles:
+        if not self.remaining:
             return None 
-        return self.tiles.pop()
-    
-    @property
-    def remaining(self):
-        return len(self.tiles)
+        self.remaining -= 1
+        return self._DECODE[self.tiles[self.remaining]]
 
     def reveal_kan_dora(self):
         current_count = len(self.dora_indicators)
         if current_count < 5:
-            next_index = 5 + (current_count * 2) 
-            self.dora_indicators.append(self.dead_wall[next_index])
+            # Every other tile from the end: 135, 133, ... 127 (ura dora sit between)
+            self.dora_indicators.append(self.tile_at(-1 - current_count * 2))
             
     def draw_replacement(self):
         """
         Draws a tile from the Dead Wall (for Kan).
         In strict rules, we should also move a tile from the live wall 
         to the dead wall to maintain 14 tiles, but for this engine,
-        popping from dead_wall is sufficient.
+        drawing from the dead wall is sufficient.
         """
-        if not self.dead_wall:
-            return None
-        # Usually drawn from the 'back' of the dead wall
-        return self.dead_wall.pop()
\ No newline at end of file
+        if self._replacement == self._dead_start + 4:
+            return None  # Only 4 replacement tiles, one per kan
+        tile = self._DECODE[self.tiles[self._replacement]]
+        self._replacement += 1
+        return tile
@@ -11,23 +11,34 @@ Usage:
 
 Or from project root:
     python main.py --web
+
+The Socket.IO async mode defaults to 'threading'. Set MAHJONG_ASYNC_MODE
+(e.g. to 'eventlet' or 'gevent') to serve from a greenlet-based event loop,
+which handles many concurrent sockets with far less per-connection overhead.
 """
 
 import os
 import sys
 import json
+import time
+from functools import lru_cache
 from pathlib import Path
 from flask import Flask, send_from_directory, request
 from flask_socketio import SocketIO, emit, join_room, leave_room
 from flask_cors import CORS
 
+try:
+    import orjson  # Optional: much faster encoding of state payloads
+except ImportError:
+    orjson = None
+
 # Add parent directory for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from backend.core.game_engine import GameEngine
 from backend.core.game_state import (
     GameState, GamePhase, GameEvent, GameEventType,
-    Action, ActionType, AvailableActions, TileState
+    Action, ActionType, AvailableActions, TileState, MeldState
 )
 from backend.ai import RandomAgent
 
@@ -36,9 +47,27 @@ from backend.ai import RandomAgent
 # Flask App Setup
 # =============================================================================
 
+class _OrjsonCodec:
+    """
+    Stand-in for the json module used by python-socketio, backed by orjson.
+    python-socketio passes json.dumps keyword arguments (e.g. separators);
+    orjson output is already compact, so they are ignored.
+    """
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    @staticmethod
+    def loads(data, **kwargs):
+        return orjson.loads(data)
+
+
 app = Flask(__name__, static_folder='../../frontend')
 CORS(app)
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
+socketio_options = {'json': _OrjsonCodec} if orjson is not None else {}
+socketio = SocketIO(app, cors_allowed_origins="*",
+                    async_mode=os.environ.get('MAHJONG_ASYNC_MODE', 'threading'),
+                    **socketio_options)
 
 
 # =============================================================================
@@ -52,44 +81,51 @@ class GameSession:
         self.session_id = session_id
         self.engine = None
         self.player_sids = {}  # seat_index -> socket_id
+        self.sid_to_seat = {}  # socket_id -> seat_index (reverse of player_sids)
+        self._occupied = 0     # Bit per seat held by a human player
         self.ai_agents = {}    # seat_index -> Agent
         self.spectators = []
         self.started = False
+        self._ai_task_running = False  # Set while process_ai_turns is looping
+        self._last_public_sig = None   # Signature of the last public_state sent
+        self.player_ser_cache = {}     # seat -> (mutation_seq, public player dict)
+        self._next_ai_ready_at = 0.0   # time.monotonic() before which the next AI action waits
     
     def add_player(self, sid: str, seat: int = None):
         """Add a human player to the session."""
         if seat is None:
-            # Find first available seat
-            for i in range(4):
-                if i not in self.player_sids:
-                    seat = i
-                    break
+            # Find first available seat: lowest clear bit of the 4-seat mask
+            free = ~self._occupied & 0xF
+            if free:
+                seat = (free & -free).bit_length() - 1
         
-        if seat is not None and seat not in self.player_sids:
+        if seat is not None and not self._occupied >> seat & 1:
             self.player_sids[seat] = sid
+            self.sid_to_seat[sid] = seat
+            self._occupied |= 1 << seat
             return seat
         return None
     
     def remove_player(self, sid: str):
         """Remove a player from the session."""
-        for seat, player_sid in list(self.player_sids.items()):
-            if player_sid == sid:
-                del self.player_sids[seat]
-                return seat
-        return None
+        seat = self.sid_to_seat.pop(sid, None)
+        if seat is not None:
+            del self.player_sids[seat]
+            self._occupied &= ~(1 << seat)
+        return seat
     
     def fill_with_ai(self):
         """Fill empty seats with AI agents."""
-        for i in range(4):
-            if i not in self.player_sids and i not in self.ai_agents:
+        free = ~self._occupied & 0xF
+        while free:
+            i = (free & -free).bit_length() - 1
+            free &= free - 1
+            if i not in self.ai_agents:
                 self.ai_agents[i] = RandomAgent(f"AI {['East', 'South', 'West', 'North'][i]}")
     
     def get_player_seat(self, sid: str):
         """Get the seat index for a player's socket ID."""
-        for seat, player_sid in self.player_sids.items():
-            if player_sid == sid:
-                return seat
-        return None
+        return self.sid_to_seat.get(sid)
 
 
 # Global session storage
@@ -108,14 +144,41 @@ def get_or_create_session(session_id: str = 'default') -> GameSession:
 # State Serialisation
 # =============================================================================
 
-def serialise_tile(tile: TileState) -> dict:
-    """Convert TileState to JSON-serialisable dict."""
+# Enum member -> wire name, so serialisers skip the Enum.name descriptor
+_PHASE_NAMES = {phase: phase.name for phase in GamePhase}
+_EVENT_NAMES = {event_type: event_type.name for event_type in GameEventType}
+
+# Shared stand-in for empty tile lists; encodes as [] without allocating
+_EMPTY: tuple = ()
+
+@lru_cache(maxsize=256)
+def _tile_wire(suit: int, value: int, is_red: bool) -> tuple:
+    # Only 37 distinct tiles exist, so single-tile fields share these tuples
+    return (suit, value, is_red)
+
+
+def serialise_tile(tile: TileState) -> tuple:
+    """Convert TileState to its wire form, a [suit, value, is_red] array."""
     if tile is None:
         return None
+    return _tile_wire(tile.suit, tile.value, tile.is_red)
+
+
+def _serialise_tiles(tiles) -> list:
+    """
+    serialise_tile over a tuple of tiles, specialised for the hot paths.
+    Hands, rivers and melds never hold None, and building the 3-tuples
+    inline is about twice as fast as a call per tile into the cache.
+    """
+    return [(t.suit, t.value, t.is_red) for t in tiles]
+
+
+def serialise_meld(meld: MeldState) -> dict:
+    """Convert MeldState to JSON-serialisable dict."""
     return {
-        'suit': tile.suit,
-        'value': tile.value,
-        'is_red': tile.is_red
+        'meld_type': meld.meld_type,
+        'tiles': _serialise_tiles(meld.tiles),
+        'called_from': meld.called_from
     }
 
 
@@ -127,12 +190,12 @@ def serialise_player(player_state, include_hand: bool = True) -> dict:
         'score': player_state.score,
         'is_riichi': player_state.is_riichi,
         'is_menzen': player_state.is_menzen,
-        'hand': [serialise_tile(t) for t in player_state.hand] if include_hand else [],
+        'hand': _serialise_tiles(player_state.hand) if include_hand else [],
         'hand_size': player_state.hand_size,
-        'discards': [serialise_tile(t) for t in player_state.discards],
-        'open_melds': list(player_state.open_melds),
+        'discards': _serialise_tiles(player_state.discards) if player_state.discards else _EMPTY,
+        'open_melds': [serialise_meld(m) for m in player_state.open_melds],
         'shanten': player_state.shanten,
-        'waits': [serialise_tile(t) for t in player_state.waits],
+        'waits': _serialise_tiles(player_state.waits) if player_state.waits else _EMPTY,
         'is_furiten': player_state.is_furiten
     }
 
@@ -142,66 +205,132 @@ def serialise_available_actions(actions: AvailableActions) -> dict:
     if actions is None:
         return None
     
+    # Actions don't change once built, so serialise each instance only once
+    cached = getattr(actions, '_ser_cache', None)
+    if cached is not None:
+        return cached
+    
     chi_options = []
     for opt in actions.chi_options:
         chi_options.append({
             'option_index': opt.option_index,
-            'tile_indices': list(opt.tile_indices),
-            'resulting_tiles': [serialise_tile(t) for t in opt.resulting_tiles]
+            'tile_indices': opt.tile_indices,
+            'resulting_tiles': _serialise_tiles(opt.resulting_tiles)
         })
     
-    return {
+    result = {
         'player_index': actions.player_index,
-        'phase': actions.phase.name,
+        'phase': _PHASE_NAMES[actions.phase],
         'can_discard': actions.can_discard,
-        'discard_indices': list(actions.discard_indices),
+        'discard_indices': actions.discard_indices,
         'can_riichi': actions.can_riichi,
-        'riichi_discard_indices': list(actions.riichi_discard_indices),
+        'riichi_discard_indices': actions.riichi_discard_indices,
         'can_tsumo': actions.can_tsumo,
-        'tsumo_yaku': list(actions.tsumo_yaku),
+        'tsumo_yaku': actions.tsumo_yaku,
         'can_ron': actions.can_ron,
-        'ron_yaku': list(actions.ron_yaku),
+        'ron_yaku': actions.ron_yaku,
         'can_pon': actions.can_pon,
         'can_kan': actions.can_kan,
         'can_chi': actions.can_chi,
         'chi_options': chi_options,
         'can_pass': actions.can_pass
     }
+    object.__setattr__(actions, '_ser_cache', result)
+    return result
 
 
 def serialise_game_state(state: GameState, for_player: int = None) -> dict:
     """Convert GameState to JSON-serialisable dict for a specific player."""
-    players = []
-    for i, p in enumerate(state.players):
-        # Only include hand for the requesting player
-        include_hand = (for_player is None) or (i == for_player)
-        players.append(serialise_player(p, include_hand=include_hand))
+    public = _serialise_public_state(state)
+    if for_player is not None:
+        return _personalise_state(public, _serialise_private_state(state, for_player))
+    
+    # No specific player: include every hand
+    players = [
+        {**p, 'hand': _serialise_tiles(player.hand)}
+        for p, player in zip(public['players'], state.players)
+    ]
+    return {**public, 'players': players}
+
+
+def _serialise_public_state(state: GameState, player_cache: dict = None) -> dict:
+    """
+    Serialise the parts of the state every recipient sees: all hands hidden
+    and no drawn tile. Built once per broadcast and shared between seats.
+    
+    With a player_cache (seat -> (mutation_seq, dict)), a seat whose player
+    hasn't changed since the last call reuses its dict; most actions only
+    touch one player.
+    """
+    if player_cache is None:
+        players = [serialise_player(p, include_hand=False) for p in state.players]
+    else:
+        players = []
+        for p in state.players:
+            cached = player_cache.get(p.index)
+            if cached is None or cached[0] != p.mutation_seq:
+                cached = (p.mutation_seq, serialise_player(p, include_hand=False))
+                player_cache[p.index] = cached
+            players.append(cached[1])
     
     return {
         'turn_count': state.turn_count,
-        'phase': state.phase.name,
+        'phase': _PHASE_NAMES[state.phase],
         'active_player_index': state.active_player_index,
         'players': players,
         'wall_remaining': state.wall_remaining,
-        'dora_indicators': [serialise_tile(t) for t in state.dora_indicators],
+        'dora_indicators': _serialise_tiles(state.dora_indicators),
         'last_discard': serialise_tile(state.last_discard),
         'last_discard_player': state.last_discard_player,
-        'drawn_tile': serialise_tile(state.drawn_tile) if for_player == state.active_player_index else None,
+        'drawn_tile': None,
         'available_actions': serialise_available_actions(state.available_actions),
         'winner_index': state.winner_index,
-        'winning_yaku': list(state.winning_yaku)
+        'winning_yaku': state.winning_yaku
     }
 
 
+def _public_state_signature(engine, state: GameState) -> tuple:
+    """
+    Cheap stand-in for comparing public payloads. Every engine step changes at
+    least one of these (a draw grows a hand, a discard grows a river, a call
+    adds a meld), so equal signatures mean an identical public state.
+    """
+    return (
+        id(engine), state.turn_count, state.phase, state.active_player_index,
+        state.wall_remaining, len(state.dora_indicators),
+        state.last_discard, state.last_discard_player,
+        state.available_actions, state.winner_index,
+        tuple((p.score, p.is_riichi, p.hand_size, len(p.discards), len(p.open_melds))
+              for p in state.players)
+    )
+
+
+def _serialise_private_state(state: GameState, seat: int) -> dict:
+    """Serialise what only this seat may see: its hand and, on its turn, the drawn tile."""
+    return {
+        'seat': seat,
+        'hand': _serialise_tiles(state.players[seat].hand),
+        'drawn_tile': serialise_tile(state.drawn_tile) if seat == state.active_player_index else None
+    }
+
+
+def _personalise_state(public: dict, private: dict) -> dict:
+    """Merge a private overlay into a shallow copy of the shared payload."""
+    seat = private['seat']
+    players = list(public['players'])
+    players[seat] = {**players[seat], 'hand': private['hand']}
+    return {**public, 'players': players, 'drawn_tile': private['drawn_tile']}
+
+
 def serialise_event(event: GameEvent) -> dict:
     """Convert GameEvent to JSON-serialisable dict."""
     return {
-        'event_type': event.event_type.name,
+        'event_type': _EVENT_NAMES[event.event_type],
         'player_index': event.player_index,
         'tile': serialise_tile(event.tile) if event.tile else None,
-        'tiles': [serialise_tile(t) for t in event.tiles],
+        'tiles': _serialise_tiles(event.tiles) if event.tiles else _EMPTY,
         'message': event.message,
-        'yaku': list(event.yaku),
+        'yaku': event.yaku,
         'data': event.data
     }
 
@@ -313,14 +442,15 @@ def handle_start_game(data):
     
     # Initialise engine
     session.engine = GameEngine(player_names)
+    session.player_ser_cache.clear()
     session.engine.setup()
     session.started = True
     
     # Send initial state to all players
     broadcast_state(session)
     
-    # Start game loop for AI turns
-    process_ai_turns(session)
+    # Start game loop for AI turns without blocking this handler
+    socketio.start_background_task(process_ai_turns, session)
 
 
 def broadcast_state(session: GameSession):
@@ -328,39 +458,71 @@ def broadcast_state(session: GameSession):
     if not session.engine:
         return
     
-    state = session.engine.get_state()
+    state = session.engine.get_state_view()
     
-    # Send personalized state to each human player
-    for seat, sid in session.player_sids.items():
-        player_state = serialise_game_state(state, for_player=seat)
-        socketio.emit('game_state', player_state, room=sid)
-
-
-def broadcast_event(session: GameSession, event: GameEvent):
-    """Send game event to all connected players."""
-    event_data = serialise_event(event)
-    socketio.emit('game_event', event_data, room=session.session_id)
+    # One public payload for the whole room, then each seat's private overlay.
+    # Clients merge the two (see MahjongGame.mergePrivateState).
+    # The AI loop often broadcasts twice with nothing in between (e.g. after a
+    # draw and again when a human is up), so identical public states are skipped.
+    sig = _public_state_signature(session.engine, state)
+    if sig != session._last_public_sig:
+        session._last_public_sig = sig
+        socketio.emit('public_state', _serialise_public_state(state, session.player_ser_cache),
+                      room=session.session_id)
+
+    # Build every overlay first (this also snapshots the seats, so a disconnect
+    # mid-broadcast can't change the dict under us), then send them in one pass
+    # straight through the Socket.IO server, skipping Flask-SocketIO's wrapper.
+    overlays = [(sid, _serialise_private_state(state, seat))
+                for seat, sid in list(session.player_sids.items())]
+    for sid, overlay in overlays:
+        socketio.server.emit('private_state', overlay, to=sid, namespace='/')
+
+
+def broadcast_events(session: GameSession, events: list):
+    """Send a batch of game events to all connected players in one message."""
+    if events:
+        socketio.emit('game_events', [serialise_event(e) for e in events], room=session.session_id)
 
 
 def process_ai_turns(session: GameSession):
-    """Process AI turns until a human player needs to act."""
+    """
+    Process AI turns until a human player needs to act.
+    Runs as a background task; at most one loop runs per session at a time.
+    """
     if not session.engine or session.engine.is_game_over:
         return
+    if session._ai_task_running:
+        return
     
-    import time
+    session._ai_task_running = True
+    try:
+        _run_ai_turns(session)
+    finally:
+        session._ai_task_running = False
+
+
+# Minimum time between AI actions, so players can follow the game
+AI_ACTION_INTERVAL = 0.3
+
+
+def _run_ai_turns(session: GameSession):
+    # A state broadcast is only worth sending when clients get to look at it:
+    # before the visual-feedback pause, or when handing over to a human.
+    # Anything in between would be overwritten within milliseconds.
+    pending_broadcast = False
     
     while not session.engine.is_game_over:
         # Advance to next decision if needed
-        if session.engine.phase == GamePhase.DRAW:
+        if session.engine.is_draw_phase:
             events = session.engine.advance_to_next_decision()
-            for event in events:
-                broadcast_event(session, event)
-            broadcast_state(session)
+            broadcast_events(session, events)
+            pending_broadcast = True
         
         if session.engine.is_game_over:
             break
         
-        state = session.engine.get_state()
+        state = session.engine.get_state_view()
         available = state.available_actions
         
         if not available:
@@ -379,17 +541,28 @@ def process_ai_turns(session: GameSession):
             agent = session.ai_agents[active_seat]
             action = agent.choose_action(state, available)
             
-            # Small delay for visual feedback
-            socketio.sleep(0.3)
+            if pending_broadcast:
+                broadcast_state(session)
+                pending_broadcast = False
+            
+            # Pace actions for visual feedback. Time already spent choosing
+            # and broadcasting counts towards the interval, and each session
+            # keeps its own deadline, so sessions don't hold each other up.
+            delay = session._next_ai_ready_at - time.monotonic()
+            if delay > 0:
+                socketio.sleep(delay)
+            session._next_ai_ready_at = time.monotonic() + AI_ACTION_INTERVAL
             
             events = session.engine.apply_action(action)
-            for event in events:
-                broadcast_event(session, event)
-            broadcast_state(session)
+            broadcast_events(session, events)
+            pending_broadcast = True
+    
+    if pending_broadcast:
+        broadcast_state(session)
     
     # Game over
     if session.engine.is_game_over:
-        state = session.engine.get_state()
+        state = session.engine.get_state_view()
         socketio.emit('game_over', serialise_game_state(state), room=session.session_id)
 
 
@@ -409,7 +582,7 @@ def handle_player_action(data):
         return
     
     # Validate it's this player's turn
-    state = session.engine.get_state()
+    state = session.engine.get_state_view()
     available = state.available_actions
     
     if not available or available.player_index != seat:
@@ -432,15 +605,14 @@ def handle_player_action(data):
         
         # Apply action
         events = session.engine.apply_action(action)
-        for event in events:
-            broadcast_event(session, event)
+        broadcast_events(session, events)
         broadcast_state(session)
         
         # Continue with AI turns
         if not session.engine.is_game_over:
             socketio.start_background_task(process_ai_turns, session)
         else:
-            state = session.engine.get_state()
+            state = session.engine.get_state_view()
             socketio.emit('game_over', serialise_game_state(state), room=session.session_id)
         
     except Exception as e:
@@ -456,6 +628,8 @@ def handle_restart_game(data):
     if session:
         session.started = False
         session.engine = None
+        session._last_public_sig = None
+        session.player_ser_cache.clear()
         socketio.emit('game_reset', {}, room=session_id)
 
 
@@ -24,6 +24,7 @@ class GameRoom:
     """Represents a game room/session."""
     room_id: str
     players: Dict[int, PlayerConnection] = field(default_factory=dict)  # seat -> connection
+    sid_to_seat: Dict[str, int] = field(default_factory=dict)  # socket_id -> seat
     spectators: list = field(default_factory=list)
     game_started: bool = False
     
@@ -32,23 +33,20 @@ class GameRoom:
         for seat in range(4):
             if seat not in self.players:
                 self.players[seat] = PlayerConnection(sid=sid, seat=seat, name=name)
+                self.sid_to_seat[sid] = seat
                 return seat
         return None
     
     def remove_player(self, sid: str) -> Optional[int]:
         """Remove a player by socket ID."""
-        for seat, player in list(self.players.items()):
-            if player.sid == sid:
-                del self.players[seat]
-                return seat
-        return None
+        seat = self.sid_to_seat.pop(sid, None)
+        if seat is not None:
+            del self.players[seat]
+        return seat
     
     def get_player_seat(self, sid: str) -> Optional[int]:
         """Get the seat for a socket ID."""
-        for seat, player in self.players.items():
-            if player.sid == sid:
-                return seat
-        return None
+        return self.sid_to_seat.get(sid)
     
     def is_full(self) -> bool:
         """Check if all seats are taken."""
@@ -4,4 +4,7 @@ Examples for the Riichi Mahjong AI framework.
 See individual example files for usage:
 - custom_ai_example.py: How to create your own AI agent
 - engine_direct_example.py: Direct engine control for training/simulation
+
+Run them from the project root as modules, e.g.
+    python -m examples.engine_direct_example
 """
@@ -7,8 +7,11 @@ Your AI just needs to implement the `choose_action` method.
 
 import sys
 import os
-# Add project root to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from collections import defaultdict
+# Run as a script (python examples/...), add the project root to the path.
+# As part of the package (python -m examples...), it's already importable.
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from backend.ai import Agent
 from backend.core import (
@@ -119,6 +122,13 @@ class MySimpleAI(Agent):
         hand = my_state.hand
         valid_indices = set(available_actions.discard_indices)
         
+        # Tally the hand once so each tile's checks below are O(1) lookups
+        counts = {}
+        by_suit_vals = defaultdict(set)
+        for t in hand:
+            counts[(t.suit, t.value)] = counts.get((t.suit, t.value), 0) + 1
+            by_suit_vals[t.suit].add(t.value)
+        
         # Score each tile (higher = more likely to discard)
         scores = []
         for i, tile_state in enumerate(hand):
@@ -132,7 +142,7 @@ class MySimpleAI(Agent):
             # Prefer discarding honors (can't form sequences)
             if tile.is_honour:
                 # But not if we have 2+ (potential pon)
-                count = sum(1 for t in hand if t.suit == tile_state.suit and t.value == tile_state.value)
+                count = counts[(tile_state.suit, tile_state.value)]
                 if count < 2:
                     score += 50
                 else:
@@ -144,12 +154,11 @@ class MySimpleAI(Agent):
             
             # Prefer isolated tiles (no neighbours)
             else:
-                has_neighbour = False
-                for t in hand:
-                    if t.suit == tile_state.suit:
-                        if abs(t.value - tile_state.value) <= 2:
-                            has_neighbour = True
-                            break
+                # A copy of itself counts (it's a pair), the tile alone doesn't
+                suit_vals = by_suit_vals[tile_state.suit]
+                v = tile_state.value
+                has_neighbour = (counts[(tile_state.suit, v)] > 1 or
+                                 any(n in suit_vals for n in (v - 2, v - 1, v + 1, v + 2)))
                 if not has_neighbour:
                     score += 40
             
@@ -11,13 +11,18 @@ which is useful for:
 
 import sys
 import os
-# Add project root to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from array import array
+from typing import Optional
+# Run as a script (python examples/...), add the project root to the path.
+# As part of the package (python -m examples...), it's already importable.
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from backend.core import (
-    GameEngine, GameState, GamePhase,
+    GameEngine, GameState,
     Action, ActionType, AvailableActions
 )
+from backend.core.game_state import MASK_TSUMO, MASK_RON, MASK_CALL_PASS, MASK_DISCARD
 
 
 def run_engine_directly():
@@ -50,7 +55,7 @@ def run_engine_directly():
         print(f"\n--- Turn {turn} ---")
         
         # Advance to decision point (handles drawing)
-        if engine.phase == GamePhase.DRAW:
+        if engine.is_draw_phase:
             engine.advance_to_next_decision()
         
         if engine.is_game_over:
@@ -83,31 +88,123 @@ def run_engine_directly():
         print(f"Yaku: {final.winning_yaku}")
 
 
+# action_mask -> the action make_simple_decision takes: the lowest set bit
+# wins, as bits are in priority order (take wins, pass on calls, discard)
+_FIRST_SET = tuple(
+    ActionType.TSUMO if mask & MASK_TSUMO else
+    ActionType.RON if mask & MASK_RON else
+    ActionType.PASS if mask & MASK_CALL_PASS else
+    ActionType.DISCARD if mask & MASK_DISCARD else
+    None
+    for mask in range(16)
+)
+
+
 def make_simple_decision(state: GameState, available: AvailableActions) -> Action:
-    """Make a simple decision (for demo purposes)."""
+    """
+    Make a simple decision (for demo purposes): take any wins, pass on
+    calls, otherwise discard the first available tile.
+    """
     player_idx = available.player_index
+    action_type = _FIRST_SET[available.action_mask]
     
-    # Take any wins
-    if available.can_tsumo:
-        return Action(ActionType.TSUMO, player_idx)
-    if available.can_ron:
-        return Action(ActionType.RON, player_idx)
-    
-    # Pass on calls
-    if available.can_pass and (available.can_pon or available.can_chi or available.can_kan):
-        return Action(ActionType.PASS, player_idx)
-    
-    # Discard first available tile
-    if available.can_discard:
-        idx = available.discard_indices[0]
-        return Action(ActionType.DISCARD, player_idx, tile_index=idx)
+    if action_type is ActionType.DISCARD:
+        return Action(ActionType.DISCARD, player_idx, tile_index=available.first_discard_index)
+    if action_type is not None:
+        return Action(action_type, player_idx)
     
     # Fallback
     actions = available.get_actions()
     return actions[0]
 
 
-def training_loop_example():
+class VectorizedMahjongEnv:
+    """
+    num_envs games stepped in lockstep, for batched self-play.
+    
+    Every game is always waiting on a decision. step() takes one action per
+    game, plays each game on to its next decision and returns a
+    (state, reward, done) row per game. The reward goes to the player who
+    acted. A game that finishes starts its next episode at once, and its row
+    holds that episode's first state. Once max_episodes have been started,
+    finished slots go idle instead: their rows are (None, 0.0, True), and
+    they take None as their action.
+    
+    episode_ids[i] numbers the episode slot i is playing (from 1), and
+    last_winners[i] holds the winner of the last one it finished (None for
+    a draw).
+    
+    The games are stepped inline, not in worker processes: a step is far
+    cheaper than pickling a GameState over a pipe. To use every core, run
+    one of these per process.
+    """
+    
+    def __init__(self, num_envs: int, max_episodes: Optional[int] = None):
+        self.num_envs = num_envs
+        self.max_episodes = max_episodes
+        self.engines = [GameEngine() for _ in range(num_envs)]
+        self.states: list[Optional[GameState]] = [None] * num_envs
+        self.episode_ids = [0] * num_envs
+        self.last_winners: list[Optional[int]] = [None] * num_envs
+        self.episodes_started = 0
+        self.num_live = 0
+    
+    def reset(self) -> list[Optional[GameState]]:
+        """Start a fresh episode in every slot (up to max_episodes) and return the states"""
+        self.episodes_started = 0
+        self.num_live = 0
+        for i in range(self.num_envs):
+            self._start_episode(i)
+        return list(self.states)
+    
+    def step(self, actions: list[Optional[Action]]) -> list[tuple[Optional[GameState], float, bool]]:
+        results = []
+        for i, action in enumerate(actions):
+            state = self.states[i]
+            if state is None:
+                results.append((None, 0.0, True))
+                continue
+            
+            engine = self.engines[i]
+            engine.apply_action(action)
+            if engine.is_draw_phase:
+                engine.advance_to_next_decision()
+            
+            if not engine.is_game_over:
+                state = self.states[i] = engine.get_state_view()
+                results.append((state, 0.0, False))
+                continue
+            
+            # Only the winner is needed, so skip building a final state
+            winner_index = self.last_winners[i] = engine.winner_index
+            if winner_index == action.player_index:
+                reward = 1.0  # Win
+            elif winner_index is not None:
+                reward = -0.5  # Loss to another player
+            else:
+                reward = 0.0  # Draw
+            
+            self.num_live -= 1
+            self._start_episode(i)
+            results.append((self.states[i], reward, True))
+        return results
+    
+    def _start_episode(self, i: int):
+        if self.max_episodes is not None and self.episodes_started >= self.max_episodes:
+            self.states[i] = None
+            return
+        # Recycle the slot's engine rather than building a new one
+        engine = self.engines[i]
+        engine.reset()
+        engine.setup()
+        engine.advance_to_next_decision()
+        self.states[i] = engine.get_state_view()
+        self.episodes_started += 1
+        self.episode_ids[i] = self.episodes_started
+        self.num_live += 1
+
+
+def training_loop_example(num_episodes: int = 5, num_envs: int = 32):
     """
     Example of a training loop for reinforcement learning.
     
@@ -115,105 +212,129 @@ def training_loop_example():
     - Self-play training
     - Experience collection
     - Policy evaluation
+    
+    Rather than playing one episode at a time (a policy network called with
+    a batch of 1), it keeps up to num_envs games in flight in a
+    VectorizedMahjongEnv. Each step asks the policy for every live game at
+    once. When a game finishes, its slot starts the next episode, reusing
+    the engine and experience buffers, so the steady-state loop allocates
+    nothing per episode.
     """
     print("\n" + "="*50)
     print("RL Training Loop Example")
     print("="*50)
     
-    num_episodes = 5
+    vec_env = VectorizedMahjongEnv(min(num_envs, num_episodes), max_episodes=num_episodes)
+    states = vec_env.reset()
     
-    for episode in range(num_episodes):
-        print(f"\n--- Episode {episode + 1} ---")
-        
-        # Create fresh engine
-        engine = GameEngine()
-        engine.setup()
+    # Experience buffers per slot, one flat column per field (structure of
+    # arrays): row i of each is step i. They're allocated once, so
+    # collection never builds per-step objects, and each column is
+    # already a contiguous block ready to copy into a training tensor.
+    buffers = [{
+        'steps': 0,
+        'features': array('f', bytes(4 * MAX_STEPS * FEAT_DIM)),  # MAX_STEPS x FEAT_DIM
+        'actions': array('b', bytes(MAX_STEPS)),      # ActionType value
+        'tile_indices': array('b', bytes(MAX_STEPS)), # Action tile_index, or -1
+        'rewards': array('f', bytes(4 * MAX_STEPS)),
+        'players': array('b', bytes(MAX_STEPS)),
+    } for _ in range(vec_env.num_envs)]
+    
+    while vec_env.num_live:
+        # Write each live game's feature vector (for neural network) into
+        # its current row
+        for buf, state in zip(buffers, states):
+            if state is not None:
+                state_to_features(state, state.available_actions.player_index,
+                                  buf['features'], buf['steps'])
         
-        # Experience buffer (state, action, reward, next_state)
-        experiences = []
+        # One policy call for the whole batch
+        actions = batched_policy(states)
+        episode_ids = list(vec_env.episode_ids)
+        results = vec_env.step(actions)
         
-        while not engine.is_game_over:
-            # Advance to decision
-            if engine.phase == GamePhase.DRAW:
-                engine.advance_to_next_decision()
-            
-            if engine.is_game_over:
-                break
-            
-            # Get state for current player
-            state = engine.get_state()
-            available = state.available_actions
-            
-            if not available:
+        for i, (action, (_, reward, done)) in enumerate(zip(actions, results)):
+            if action is None:
                 continue
+            buf = buffers[i]
             
-            player_idx = available.player_index
-            
-            # Convert state to feature vector (for neural network)
-            features = state_to_features(state, player_idx)
+            # Store the rest of the experience in the same row
+            row = buf['steps']
+            buf['actions'][row] = action.action_type.value
+            buf['tile_indices'][row] = -1 if action.tile_index is None else action.tile_index
+            buf['rewards'][row] = reward
+            buf['players'][row] = action.player_index
+            buf['steps'] = row + 1
             
-            # Get action from your policy (placeholder)
-            action = make_simple_decision(state, available)
-            
-            # Apply action
-            engine.apply_action(action)
-            
-            # Get next state
-            next_state = engine.get_state()
-            
-            # Calculate immediate reward (0 for most actions)
-            reward = 0
-            if engine.is_game_over:
-                if next_state.winner_index == player_idx:
-                    reward = 1.0  # Win
-                elif next_state.winner_index is not None:
-                    reward = -0.5  # Loss to another player
-                # Draw = 0
-            
-            # Store experience
-            experiences.append({
-                'state': features,
-                'action': action,
-                'reward': reward,
-                'player': player_idx
-            })
+            if done:
+                # After episode, you would:
+                # 1. Calculate returns/advantages from the first buf['steps'] rows
+                # 2. Update policy network
+                # 3. Log statistics
+                winner_index = vec_env.last_winners[i]
+                winner = winner_index if winner_index is not None else "Draw"
+                print(f"--- Episode {episode_ids[i]} --- Result: Winner = {winner}, "
+                      f"Experiences: {buf['steps']}")
+                
+                # The slot has moved on to its next episode, if any
+                buf['steps'] = 0
         
-        # After episode, you would:
-        # 1. Calculate returns/advantages
-        # 2. Update policy network
-        # 3. Log statistics
-        
-        final = engine.get_state()
-        winner = final.winner_index if final.winner_index is not None else "Draw"
-        print(f"  Result: Winner = {winner}, Experiences: {len(experiences)}")
+        states = [result[0] for result in results]
+
+
+def batched_policy(states: list) -> list:
+    """
+    Choose an action for each state in a batch, or None where the slot is idle.
+    
+    A neural network policy would gather each game's current feature row
+    and run a single forward pass here; this placeholder decides each row
+    on its own.
+    """
+    return [make_simple_decision(state, state.available_actions) if state is not None else None
+            for state in states]
+
+
+# Feature columns written by state_to_features
+_TURN = 0
+_WALL = 1
+_HAND = 2
+_SHANTEN = 3
+_RIICHI = 4
+_FURITEN = 5
+_SCORE = 6
+FEAT_DIM = 7  # Add: hand tiles as one-hot, discards, dora, etc. as further columns
+
+# Rows per experience buffer: comfortably more decisions than one game can have
+MAX_STEPS = 1024
 
 
-def state_to_features(state: GameState, player_idx: int) -> dict:
+def state_to_features(state: GameState, player_idx: int, out: array, row: int):
     """
-    Convert game state to feature dictionary for ML.
+    Write the game state's features for ML into row `row` of `out`, a
+    flat float array of FEAT_DIM columns.
     
-    In a real implementation, you'd convert this to tensors.
+    In a real implementation, you'd view these buffers as tensors.
     """
     player = state.get_player(player_idx)
+    base = row * FEAT_DIM
     
     # Example features (expand for real use)
-    return {
-        'turn': state.turn_count,
-        'wall_remaining': state.wall_remaining,
-        'hand_size': player.hand_size,
-        'shanten': player.shanten,
-        'is_riichi': player.is_riichi,
-        'is_furiten': player.is_furiten,
-        'score': player.score,
-        # Add: hand tiles as one-hot, discards, dora, etc.
-    }
+    out[base + _TURN] = state.turn_count
+    out[base + _WALL] = state.wall_remaining
+    out[base + _HAND] = player.hand_size
+    out[base + _SHANTEN] = player.shanten
+    out[base + _RIICHI] = player.is_riichi
+    out[base + _FURITEN] = player.is_furiten
+    out[base + _SCORE] = player.score
 
 
 def clone_for_simulation():
     """
     Example of cloning the engine for lookahead/simulation.
     
-    Useful for Monte Carlo Tree Search or Minimax.
+    Useful for Monte Carlo Tree Search or Minimax. snapshot() is a
+    copy-on-write fork: it shares state with the original until either
+    engine moves, so it's far cheaper than clone()'s deep copy.
     """
     print("\n" + "="*50)
     print("Engine Cloning Example (for MCTS/Minimax)")
@@ -225,7 +346,7 @@ def clone_for_simulation():
     
     # Advance a few turns
     for _ in range(5):
-        if engine.phase == GamePhase.DRAW:
+        if engine.is_draw_phase:
             engine.advance_to_next_decision()
         if engine.is_game_over:
             break
@@ -239,12 +360,12 @@ def clone_for_simulation():
     print(f"Original engine turn: {engine.turn_count}")
     print(f"Original phase: {engine.phase.name}")
     
-    # Clone for simulation
-    simulated = engine.clone()
+    # Fork for simulation
+    simulated = engine.snapshot()
     
     # Run simulation on clone (doesn't affect original)
     for _ in range(10):
-        if simulated.phase == GamePhase.DRAW:
+        if simulated.is_draw_phase:
             simulated.advance_to_next_decision()
         if simulated.is_game_over:
             break
@@ -16,6 +16,7 @@ class MahjongGame {
 
         // Game state
         this.gameState = null;
+        this.publicState = null; // Last 'public_state', awaiting our overlay
         this.selectedTileIndex = null;
         this.myTurn = false;
 
@@ -227,12 +228,26 @@ class MahjongGame {
                 console.log(`Joined game at seat ${data.seat}`);
             });
 
-            this.socket.on("game_state", (state) => {
-                this.updateGameState(state);
+            // State arrives as a shared public part (all hands hidden)
+            // followed by our private overlay (our hand and drawn tile)
+            this.socket.on("public_state", (state) => {
+                this.publicState = state;
+                if (this.playerSeat === null) {
+                    this.updateGameState(state);
+                }
+            });
+
+            this.socket.on("private_state", (overlay) => {
+                if (this.publicState) {
+                    this.updateGameState(
+                        this.mergePrivateState(this.publicState, overlay)
+                    );
+                }
             });
 
-            this.socket.on("game_event", (event) => {
-                this.handleGameEvent(event);
+            // Events produced by one action arrive together, in order
+            this.socket.on("game_events", (events) => {
+                events.forEach((event) => this.handleGameEvent(event));
             });
 
             this.socket.on("game_over", (state) => {
@@ -308,6 +323,22 @@ class MahjongGame {
         }
     }
 
+    /**
+     * Combine a public state with a seat's private overlay
+     */
+    mergePrivateState(publicState, overlay) {
+        const players = publicState.players.slice();
+        players[overlay.seat] = {
+            ...players[overlay.seat],
+            hand: overlay.hand,
+        };
+        return {
+            ...publicState,
+            players,
+            drawn_tile: overlay.drawn_tile,
+        };
+    }
+
     /**
      * Update game state from server
      */
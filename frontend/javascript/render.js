@@ -62,11 +62,12 @@ const TileRenderer = {
 
     /**
      * Create a tile element from tile data
-     * @param {Object} tile - Tile data {suit, value, is_red}
+     * @param {Array} tile - Tile data [suit, value, is_red]
      * @param {Object} options - Rendering options
      * @returns {HTMLElement}
      */
     createTile(tile, options = {}) {
+        const [suit, value, isRed] = tile;
         const {
             size = "normal", // 'normal', 'small', 'mini'
             selectable = false,
@@ -92,13 +93,13 @@ const TileRenderer = {
         }
 
         // Add suit class
-        const suitClass = this.SUIT_CLASSES[tile.suit];
+        const suitClass = this.SUIT_CLASSES[suit];
         if (suitClass) {
             tileEl.classList.add(suitClass);
         }
 
         // Add red dora styling
-        if (tile.is_red) {
+        if (isRed) {
             tileEl.classList.add("red");
         }
 
@@ -125,20 +126,20 @@ const TileRenderer = {
         suitEl.className = "tile-suit";
 
         // Set content based on tile type
-        if (tile.suit === this.SUIT.HONOUR) {
-            valueEl.textContent = this.HONOUR_NAMES[tile.value] || "?";
+        if (suit === this.SUIT.HONOUR) {
+            valueEl.textContent = this.HONOUR_NAMES[value] || "?";
             suitEl.textContent = "";
-        } else if (tile.suit === this.SUIT.MAN) {
+        } else if (suit === this.SUIT.MAN) {
             // Use Chinese numerals for Man tiles
-            valueEl.textContent = this.MAN_NUMERALS[tile.value] || tile.value;
+            valueEl.textContent = this.MAN_NUMERALS[value] || value;
             suitEl.textContent = "萬";
-        } else if (tile.suit === this.SUIT.PIN) {
+        } else if (suit === this.SUIT.PIN) {
             // Use circles representation
-            valueEl.textContent = this.getPinDisplay(tile.value);
+            valueEl.textContent = this.getPinDisplay(value);
             suitEl.textContent = "";
-        } else if (tile.suit === this.SUIT.SOU) {
+        } else if (suit === this.SUIT.SOU) {
             // Bamboo - use number with bamboo character
-            valueEl.textContent = tile.value;
+            valueEl.textContent = value;
             suitEl.textContent = "Sou";
         }
 
@@ -148,9 +149,9 @@ const TileRenderer = {
         }
 
         // Store tile data
-        tileEl.dataset.suit = tile.suit;
-        tileEl.dataset.value = tile.value;
-        tileEl.dataset.isRed = tile.is_red || false;
+        tileEl.dataset.suit = suit;
+        tileEl.dataset.value = value;
+        tileEl.dataset.isRed = isRed;
 
         return tileEl;
     },
@@ -172,7 +173,7 @@ const TileRenderer = {
      * @returns {HTMLElement}
      */
     createBackTile(size = "small") {
-        return this.createTile({ suit: 0, value: 0 }, { size, showBack: true });
+        return this.createTile([0, 0, false], { size, showBack: true });
     },
 
     /**
@@ -288,80 +289,16 @@ const TileRenderer = {
         });
     },
 
-    /**
-     * Parse meld string to structured data
-     * Format: "[Pon: 5m 5m 5m]" or "[Chi: 3p 4p 5p]"
-     * @param {string} meldStr
-     * @returns {Object}
-     */
-    parseMeldString(meldStr) {
-        // Extract meld type
-        const ponMatch = meldStr.match(/\[Pon:/);
-        const chiMatch = meldStr.match(/\[Chi:/);
-        const kanMatch = meldStr.match(/\[Kan:/);
-
-        const type = ponMatch
-            ? "pon"
-            : chiMatch
-            ? "chi"
-            : kanMatch
-            ? "kan"
-            : "unknown";
-
-        // Extract tiles from string
-        // Format: "Xm" (man), "Xp" (pin), "Xs" (sou), or honour names
-        const tileRegex =
-            /(\d)[mps]|East|South|West|North|White|Green|Red|Haku|Hatsu|Chun/gi;
-        const matches = [...meldStr.matchAll(tileRegex)];
-
-        const tiles = matches.map((match) => {
-            const str = match[0].toLowerCase();
-
-            // Check for honours
-            const honourMap = {
-                east: { suit: 4, value: 1 },
-                south: { suit: 4, value: 2 },
-                west: { suit: 4, value: 3 },
-                north: { suit: 4, value: 4 },
-                white: { suit: 4, value: 5 },
-                haku: { suit: 4, value: 5 },
-                green: { suit: 4, value: 6 },
-                hatsu: { suit: 4, value: 6 },
-                red: { suit: 4, value: 7 },
-                chun: { suit: 4, value: 7 },
-            };
-
-            if (honourMap[str]) {
-                return { ...honourMap[str], is_red: false };
-            }
-
-            // Parse suited tiles
-            const value = parseInt(match[1]);
-            const suitChar = str.slice(-1);
-            const suitMap = { m: 1, p: 2, s: 3 };
-
-            return {
-                suit: suitMap[suitChar] || 1,
-                value: value,
-                is_red: false,
-            };
-        });
-
-        return { type, tiles };
-    },
-
     /**
      * Render a meld
-     * @param {string} meldStr
+     * @param {Object} meld - Meld data {meld_type, tiles, called_from}
      * @param {HTMLElement} container
      */
-    renderMeld(meldStr, container) {
-        const meldData = this.parseMeldString(meldStr);
-
+    renderMeld(meld, container) {
         const meldEl = document.createElement("div");
         meldEl.className = "meld";
 
-        meldData.tiles.forEach((tile) => {
+        meld.tiles.forEach((tile) => {
             const tileEl = this.createTile(tile, { size: "small" });
             meldEl.appendChild(tileEl);
         });
@@ -371,7 +308,7 @@ const TileRenderer = {
 
     /**
      * Render all melds for a player
-     * @param {Array} melds - Array of meld strings
+     * @param {Array} melds - Array of meld objects
      * @param {HTMLElement} container
      */
     renderMelds(melds, container) {
@@ -381,24 +318,25 @@ const TileRenderer = {
             return;
         }
 
-        melds.forEach((meldStr) => {
-            this.renderMeld(meldStr, container);
+        melds.forEach((meld) => {
+            this.renderMeld(meld, container);
         });
     },
 
     /**
      * Get tile name for display
-     * @param {Object} tile
+     * @param {Array} tile - Tile data [suit, value, is_red]
      * @returns {string}
      */
     getTileName(tile) {
-        if (tile.suit === this.SUIT.HONOUR) {
-            return this.HONOUR_FULL_NAMES[tile.value] || "Unknown";
+        const [suit, value, isRed] = tile;
+        if (suit === this.SUIT.HONOUR) {
+            return this.HONOUR_FULL_NAMES[value] || "Unknown";
         }
 
-        const suitName = this.SUIT_NAMES[tile.suit] || "?";
-        const redSuffix = tile.is_red ? " (Red)" : "";
-        return `${tile.value} ${suitName}${redSuffix}`;
+        const suitName = this.SUIT_NAMES[suit] || "?";
+        const redSuffix = isRed ? " (Red)" : "";
+        return `${value} ${suitName}${redSuffix}`;
     },
 };
 
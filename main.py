@@ -96,32 +96,85 @@ def run_test_game():
     return final_state
 
 
-def run_simulation(num_games: int = 100):
-    """Run multiple games for AI testing/statistics."""
+_worker_controller = None  # Each worker process's GameController, reused across its games
+PROGRESS_INTERVAL = 0.5  # Seconds between run_simulation progress lines
+
+
+def _play_one_game(seed: int):
+    """
+    Play one all-bot game for run_simulation. Top-level so worker processes
+    can pickle it. Returns (phase, winner_index).
+    """
+    import random
     from backend.core.game_controller import GameController
-    from backend.core.game_state import GamePhase
     from backend.ai import RandomAgent
+    global _worker_controller
     
-    print(f"\nRunning {num_games} simulated games...")
+    random.seed(seed)  # Deterministic wall per game, whichever worker runs it
     
-    wins = [0, 0, 0, 0]
-    draws = 0
-    
-    for i in range(num_games):
+    controller = _worker_controller
+    if controller is None:
         controller = GameController()
+        controller.quiet_mode = True  # Nobody reads the events
         for j in range(4):
             controller.set_agent(j, RandomAgent(f"Bot {j}"))
         
         controller.turn_delay = 0  # No delays
-        final_state = controller.run_game()
-        
-        if final_state.phase == GamePhase.GAME_OVER_WIN:
-            wins[final_state.winner_index] += 1
-        else:
-            draws += 1
-        
-        if (i + 1) % 10 == 0:
-            print(f"  Completed {i + 1}/{num_games} games...")
+        _worker_controller = controller
+    else:
+        # Reshuffle and clear the previous game instead of rebuilding everything
+        controller.reset()
+    
+    # Each bot has its own RNG; derive its seed from the game's
+    for j in range(4):
+        controller.get_agent(j).seed(seed * 4 + j)
+    
+    final_state = controller.run_game()
+    return final_state.phase, final_state.winner_index
+
+
+def run_simulation(num_games: int = 100):
+    """Run multiple games for AI testing/statistics, spread across all CPU cores."""
+    import os
+    import time
+    import multiprocessing
+    from backend.core.game_state import GamePhase
+    
+    print(f"\nRunning {num_games} simulated games...")
+    
+    wins = [0, 0, 0, 0]
+    draws = 0
+    
+    # Games share nothing, so each worker plays whole games and only the
+    # result comes back. Chunking amortises the IPC per task.
+    processes = os.cpu_count() or 1
+    chunksize = max(1, num_games // (4 * processes))
+    
+    # Start workers from a forkserver that has already imported the game,
+    # so each one starts with it loaded rather than importing it afresh
+    # (as spawn would), and without forking this process's threads.
+    # Platforms without forkserver (Windows) use their default.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["backend.core", "backend.ai"])
+    else:
+        context = multiprocessing.get_context()
+    
+    # Progress is reported at most twice a second, however fast games finish
+    next_report = time.monotonic() + PROGRESS_INTERVAL
+    
+    with context.Pool(processes=processes) as pool:
+        results = pool.imap_unordered(_play_one_game, range(num_games), chunksize=chunksize)
+        for i, (phase, winner_index) in enumerate(results):
+            if phase == GamePhase.GAME_OVER_WIN:
+                wins[winner_index] += 1
+            else:
+                draws += 1
+            
+            now = time.monotonic()
+            if now >= next_report:
+                next_report = now + PROGRESS_INTERVAL
+                print(f"  Completed {i + 1}/{num_games} games...")
     
     print("\nSimulation Results:")
     print(f"  Total Games: {num_games}")